@@ -34,6 +34,30 @@ from ui.views import PaginatorView
 # Import tasks
 from tasks import setup_dashboard_in_channel
 
+# Static help text for the legacy config overview
+USAGE_EXAMPLES_VALUE = (
+    "**Interactive (Recommended):** `/config`\n"
+    "**Legacy Channels:** `/config-legacy category:Channels setting:sign_log_channel value:<channel_id>`\n"
+    "**Legacy Roles:** `/config-legacy category:Roles setting:referee_role value:<role_id>`\n"
+    "**Legacy Settings:** `/config-legacy category:Settings setting:team_member_cap value:10`\n"
+    "**Legacy Dashboard:** `/config-legacy category:Dashboard action:setup value:<channel_id>`"
+)
+
+# Legacy role settings -> (RequiredRolesHandler action, role list scope)
+ROLE_ACTIONS = {
+    "add_required_role": ("add", "all"),
+    "remove_required_role": ("remove", "all"),
+    "add_one_of_required_role": ("add", "one_of"),
+    "remove_one_of_required_role": ("remove", "one_of"),
+}
+ROLE_VIEWS = {"view_required_roles": "all", "view_one_of_required_roles": "one_of"}
+ROLE_CLEARS = {"clear_required_roles": "all", "clear_one_of_required_roles": "one_of"}
+
+_VIEW_ROLE_SETTINGS = frozenset(ROLE_VIEWS)
+_CLEAR_ROLE_SETTINGS = frozenset(ROLE_CLEARS)
+_MOD_ROLE_SETTINGS = frozenset(ROLE_ACTIONS)
+_ROLE_LIST_ACTIONS = frozenset({"add", "remove"})
+
 # ========================= ENHANCED CONFIGURATION UI COMPONENTS =========================
 
 class ConfigMainMenu(ui.Select):
@@ -820,7 +844,7 @@ class RoleManagementModal(ui.Modal, title="Role Management"):
         
         role_type_display = "ALL Required" if role_type == "all" else "One-Of Required"
         
-        if action in ["add", "remove"]:
+        if action in _ROLE_LIST_ACTIONS:
             self.role_input = ui.TextInput(
                 label=f"🔧 {action.title()} {role_type_display} Role",
                 placeholder="Role ID, @role mention, or role name",
@@ -848,7 +872,7 @@ class RoleManagementModal(ui.Modal, title="Role Management"):
     
     async def on_submit(self, interaction: discord.Interaction):
         try:
-            if self.action in ["add", "remove"]:
+            if self.action in _ROLE_LIST_ACTIONS:
                 role_input = self.role_input.value.strip()
                 
                 # Parse role input
@@ -2824,6 +2848,13 @@ class EnhancedConfigView(ui.View):
 class AdminCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
+        self._category_dispatch = {
+            "view": self._legacy_view,
+            "channels": self._legacy_channels,
+            "roles": self._legacy_roles,
+            "settings": self._legacy_settings,
+            "dashboard": self._legacy_dashboard,
+        }
         print(f"🔧 Enhanced AdminCommands cog initialized with {len(self.__cog_app_commands__)} commands")
 
     async def cog_load(self):
@@ -3185,14 +3216,16 @@ class AdminCommands(commands.Cog):
             # Get all teams
             async with aiosqlite.connect(DB_PATH) as db:
                 async with db.execute(
-                    "SELECT team_id, role_id, emoji, name FROM teams"
+                    "SELECT teams.team_id, teams.role_id, teams.emoji, teams.name, COUNT(players.user_id) "
+                    "FROM teams LEFT JOIN players ON players.team_id = teams.team_id GROUP BY teams.team_id"
                 ) as cursor:
                     teams = await cursor.fetchall()
             
             ownerless_teams = []
+            member_counts = {}
             
             for team in teams:
-                team_id, role_id, emoji, name = team
+                team_id, role_id, emoji, name, member_count = team
                 
                 # Get the team role
                 team_role = interaction.guild.get_role(role_id)
@@ -3208,17 +3241,20 @@ class AdminCommands(commands.Cog):
                 
                 if not has_owner:
                     ownerless_teams.append((team_id, role_id, emoji, name, None))
+                    member_counts[team_id] = member_count
             
-            # Send alerts for ownerless teams
-            alerts_sent = 0
+            # Queue alerts for ownerless teams
+            alerts_queued = 0
             for team in ownerless_teams:
-                await send_team_owner_alert(
+                queued = await send_team_owner_alert(
                     self.bot, 
                     team, 
                     "No owner assigned", 
-                    "Role-based check discovered ownerless team"
+                    "Role-based check discovered ownerless team",
+                    member_count=member_counts[team[0]]
                 )
-                alerts_sent += 1
+                if queued:
+                    alerts_queued += 1
             
             # Create response embed
             embed = discord.Embed(
@@ -3242,7 +3278,7 @@ class AdminCommands(commands.Cog):
             if ownerless_teams:
                 embed.add_field(
                     name="⚠️ Teams Without Owners",
-                    value=f"**Found:** {len(ownerless_teams)} teams\n**Alerts Sent:** {alerts_sent}",
+                    value=f"**Found:** {len(ownerless_teams)} teams\n**Alerts Queued:** {alerts_queued}",
                     inline=True
                 )
                 
@@ -3396,273 +3432,258 @@ class AdminCommands(commands.Cog):
             return
 
         try:
-            if category.value == "view":
-                # Show the view config functionality
-                await interaction.response.defer(ephemeral=True)
-                
-                embed = discord.Embed(
-                    title="⚙️ Bot Configuration (Legacy View)",
-                    description="💡 **Tip:** Use `/config` for the new interactive configuration panel!",
-                    color=discord.Color.blue()
-                )
+            handler = self._category_dispatch.get(category.value)
+            if handler:
+                await handler(interaction, setting, value, action)
+        except ValueError as e:
+            await self._send_error(interaction, category, action, f"❌ {e}")
+        except Exception as e:
+            await self._send_error(interaction, category, action, f"❌ Error: {e}")
 
-                # Channel configurations
-                channels = [
-                    ("Sign Log Channel", await get_sign_log_channel_id()),
-                    ("Schedule Log Channel", await get_schedule_log_channel_id()),
-                    ("Game Results Channel", await get_game_results_channel_id()),
-                    ("Game Reminder Channel", await get_game_reminder_channel_id()),
-                    ("Demand Log Channel", await get_demand_log_channel_id()),
-                    ("Blacklist Log Channel", await get_blacklist_log_channel_id()),
-                    ("Team Owner Alert Channel", await get_team_owner_alert_channel_id()),
-                    ("LFP/Recruitment Channel", await get_team_announcements_channel_id()),
-                    ("LFT (Looking for Team) Channel", await get_lft_channel_id()),
-                    ("Team Owner Dashboard Channel", await get_team_owner_dashboard_channel_id())
-                ]
+    async def _send_error(self, interaction: discord.Interaction, category, action, msg: str):
+        """Send an error, using the followup when dashboard setup already responded."""
+        if category.value == "dashboard" and action == "setup":
+            await interaction.followup.send(msg, ephemeral=True)
+        else:
+            await interaction.response.send_message(msg, ephemeral=True)
 
-                channel_text = ""
-                for name, channel_id in channels:
-                    if channel_id and channel_id != 0:
-                        channel = interaction.guild.get_channel(channel_id)
-                        if channel:
-                            channel_text += f"**{name}:** {channel.mention}\n"
-                        else:
-                            channel_text += f"**{name}:** Not found (`{channel_id}`)\n"
-                    else:
-                        channel_text += f"**{name}:** Not configured\n"
+    async def _legacy_view(self, interaction: discord.Interaction, setting, value, action):
+        """Show the full configuration overview."""
+        # Show the view config functionality
+        await interaction.response.defer(ephemeral=True)
+        
+        embed = discord.Embed(
+            title="⚙️ Bot Configuration (Legacy View)",
+            description="💡 **Tip:** Use `/config` for the new interactive configuration panel!",
+            color=discord.Color.blue()
+        )
 
-                embed.add_field(name="📺 Channels", value=channel_text, inline=False)
+        # Channel configurations
+        channels = [
+            ("Sign Log Channel", await get_sign_log_channel_id()),
+            ("Schedule Log Channel", await get_schedule_log_channel_id()),
+            ("Game Results Channel", await get_game_results_channel_id()),
+            ("Game Reminder Channel", await get_game_reminder_channel_id()),
+            ("Demand Log Channel", await get_demand_log_channel_id()),
+            ("Blacklist Log Channel", await get_blacklist_log_channel_id()),
+            ("Team Owner Alert Channel", await get_team_owner_alert_channel_id()),
+            ("LFP/Recruitment Channel", await get_team_announcements_channel_id()),
+            ("LFT (Looking for Team) Channel", await get_lft_channel_id()),
+            ("Team Owner Dashboard Channel", await get_team_owner_dashboard_channel_id())
+        ]
 
-                # Role configurations
-                roles = [
-                    ("Referee Role", await get_referee_role_id()),
-                    ("Official Game Ping Role", await get_official_ping_role_id()),
-                    ("Free Agent Role", await get_free_agent_role_id()),
-                    ("Vice Captain Role", await get_vice_captain_role_id())
-                ]
+        channel_text = ""
+        for name, channel_id in channels:
+            if channel_id and channel_id != 0:
+                channel = interaction.guild.get_channel(channel_id)
+                if channel:
+                    channel_text += f"**{name}:** {channel.mention}\n"
+                else:
+                    channel_text += f"**{name}:** Not found (`{channel_id}`)\n"
+            else:
+                channel_text += f"**{name}:** Not configured\n"
 
-                role_text = ""
-                for name, role_id in roles:
-                    if role_id and role_id != 0:
-                        role = interaction.guild.get_role(role_id)
-                        if role:
-                            role_text += f"**{name}:** {role.mention}\n"
-                        else:
-                            role_text += f"**{name}:** Not found (`{role_id}`)\n"
-                    else:
-                        role_text += f"**{name}:** Not configured\n"
+        embed.add_field(name="📺 Channels", value=channel_text, inline=False)
 
-                embed.add_field(name="👥 Roles", value=role_text, inline=False)
+        # Role configurations
+        roles = [
+            ("Referee Role", await get_referee_role_id()),
+            ("Official Game Ping Role", await get_official_ping_role_id()),
+            ("Free Agent Role", await get_free_agent_role_id()),
+            ("Vice Captain Role", await get_vice_captain_role_id())
+        ]
 
-                # Required roles for signing (ALL required)
-                required_role_ids = await get_required_roles()
-                if required_role_ids:
-                    required_roles = []
-                    missing_roles = []
-                    
-                    for role_id in required_role_ids:
-                        role = interaction.guild.get_role(role_id)
-                        if role:
-                            required_roles.append(role.mention)
-                        else:
-                            missing_roles.append(f"Missing (`{role_id}`)")
-                    
-                    required_text = ""
-                    if required_roles:
-                        required_text += ", ".join(required_roles)
-                    if missing_roles:
-                        if required_text:
-                            required_text += "\n⚠️ "
-                        required_text += ", ".join(missing_roles)
-                    
-                    embed.add_field(
-                        name=f"🔒 Required Roles for Signing (ALL) - ({len(required_role_ids)})",
-                        value=f"{required_text}\n*Users must have ALL of these roles*",
-                        inline=False
-                    )
+        role_text = ""
+        for name, role_id in roles:
+            if role_id and role_id != 0:
+                role = interaction.guild.get_role(role_id)
+                if role:
+                    role_text += f"**{name}:** {role.mention}\n"
                 else:
-                    embed.add_field(
-                        name="🔒 Required Roles for Signing (ALL)",
-                        value="*None required*",
-                        inline=False
-                    )
+                    role_text += f"**{name}:** Not found (`{role_id}`)\n"
+            else:
+                role_text += f"**{name}:** Not configured\n"
 
-                # One-of required roles for signing (AT LEAST ONE required)
-                one_of_required_role_ids = await get_one_of_required_roles()
-                if one_of_required_role_ids:
-                    one_of_required_roles = []
-                    one_of_missing_roles = []
-                    
-                    for role_id in one_of_required_role_ids:
-                        role = interaction.guild.get_role(role_id)
-                        if role:
-                            one_of_required_roles.append(role.mention)
-                        else:
-                            one_of_missing_roles.append(f"Missing (`{role_id}`)")
-                    
-                    one_of_required_text = ""
-                    if one_of_required_roles:
-                        one_of_required_text += ", ".join(one_of_required_roles)
-                    if one_of_missing_roles:
-                        if one_of_required_text:
-                            one_of_required_text += "\n⚠️ "
-                        one_of_required_text += ", ".join(one_of_missing_roles)
-                    
-                    embed.add_field(
-                        name=f"🔀 One-Of Required Roles for Signing ({len(one_of_required_role_ids)})",
-                        value=f"{one_of_required_text}\n*Users need AT LEAST ONE of these roles*",
-                        inline=False
-                    )
+        embed.add_field(name="👥 Roles", value=role_text, inline=False)
+
+        # Required roles for signing (ALL required)
+        required_role_ids = await get_required_roles()
+        if required_role_ids:
+            required_roles = []
+            missing_roles = []
+            
+            for role_id in required_role_ids:
+                role = interaction.guild.get_role(role_id)
+                if role:
+                    required_roles.append(role.mention)
                 else:
-                    embed.add_field(
-                        name="🔀 One-Of Required Roles for Signing",
-                        value="*None configured*",
-                        inline=False
-                    )
+                    missing_roles.append(f"Missing (`{role_id}`)")
+            
+            parts = []
+            if required_roles:
+                parts.append(", ".join(required_roles))
+            if missing_roles:
+                parts.append("⚠️ " + ", ".join(missing_roles))
+            required_text = "\n".join(parts)
+            
+            embed.add_field(
+                name=f"🔒 Required Roles for Signing (ALL) - ({len(required_role_ids)})",
+                value=f"{required_text}\n*Users must have ALL of these roles*",
+                inline=False
+            )
+        else:
+            embed.add_field(
+                name="🔒 Required Roles for Signing (ALL)",
+                value="*None required*",
+                inline=False
+            )
 
-                # Other settings
-                cap = await get_team_member_cap()
-                signing_open = await is_signing_open()
-                max_demands = await get_max_demands_allowed()
-                
-                settings_text = f"**Team Member Cap:** {cap} members\n**Signing Open:** {'✅ Yes' if signing_open else '❌ No'}\n**Max Demands Allowed:** {max_demands} per player"
-                embed.add_field(name="⚙️ General Settings", value=settings_text, inline=False)
+        # One-of required roles for signing (AT LEAST ONE required)
+        one_of_required_role_ids = await get_one_of_required_roles()
+        if one_of_required_role_ids:
+            one_of_required_roles = []
+            one_of_missing_roles = []
+            
+            for role_id in one_of_required_role_ids:
+                role = interaction.guild.get_role(role_id)
+                if role:
+                    one_of_required_roles.append(role.mention)
+                else:
+                    one_of_missing_roles.append(f"Missing (`{role_id}`)")
+            
+            parts = []
+            if one_of_required_roles:
+                parts.append(", ".join(one_of_required_roles))
+            if one_of_missing_roles:
+                parts.append("⚠️ " + ", ".join(one_of_missing_roles))
+            one_of_required_text = "\n".join(parts)
+            
+            embed.add_field(
+                name=f"🔀 One-Of Required Roles for Signing ({len(one_of_required_role_ids)})",
+                value=f"{one_of_required_text}\n*Users need AT LEAST ONE of these roles*",
+                inline=False
+            )
+        else:
+            embed.add_field(
+                name="🔀 One-Of Required Roles for Signing",
+                value="*None configured*",
+                inline=False
+            )
 
-                # Add usage examples
-                embed.add_field(
-                    name="📝 Usage Examples",
-                    value=(
-                        "**Interactive (Recommended):** `/config`\n"
-                        "**Legacy Channels:** `/config-legacy category:Channels setting:sign_log_channel value:<channel_id>`\n"
-                        "**Legacy Roles:** `/config-legacy category:Roles setting:referee_role value:<role_id>`\n"
-                        "**Legacy Settings:** `/config-legacy category:Settings setting:team_member_cap value:10`\n"
-                        "**Legacy Dashboard:** `/config-legacy category:Dashboard action:setup value:<channel_id>`"
-                    ),
-                    inline=False
-                )
+        # Other settings
+        cap = await get_team_member_cap()
+        signing_open = await is_signing_open()
+        max_demands = await get_max_demands_allowed()
+        
+        settings_text = f"**Team Member Cap:** {cap} members\n**Signing Open:** {'✅ Yes' if signing_open else '❌ No'}\n**Max Demands Allowed:** {max_demands} per player"
+        embed.add_field(name="⚙️ General Settings", value=settings_text, inline=False)
 
-                await interaction.followup.send(embed=embed, ephemeral=True)
-                return
+        # Add usage examples
+        embed.add_field(
+            name="📝 Usage Examples",
+            value=USAGE_EXAMPLES_VALUE,
+            inline=False
+        )
 
-            elif category.value == "channels":
-                if not setting or not value:
-                    await interaction.response.send_message(
-                        "❌ For channel configuration, provide: `setting` and `value`\n"
-                        "**Available settings:** sign_log_channel, schedule_log_channel, game_results_channel, "
-                        "game_reminder_channel, demand_log_channel, blacklist_log_channel, team_owner_alert_channel, "
-                        "team_announcements_channel, lft_channel\n\n"
-                        "💡 **Tip:** Use `/config` for the new interactive configuration panel!",
-                        ephemeral=True
-                    )
-                    return
-                
-                handler = ConfigHandler(interaction)
-                embed = await handler.handle_channel_config(setting, setting.replace('_', ' ').title(), value)
-                await interaction.response.send_message(embed=embed)
+        await interaction.followup.send(embed=embed, ephemeral=True)
 
-            elif category.value == "roles":
-                if not setting:
-                    await interaction.response.send_message(
-                        "❌ For role configuration, provide: `setting` and (usually) `value`\n"
-                        "**Available settings:** referee_role, official_ping_role, vice_captain_role, free_agent_role, "
-                        "add_required_role, remove_required_role, clear_required_roles, "
-                        "add_one_of_required_role, remove_one_of_required_role, clear_one_of_required_roles, "
-                        "view_required_roles, view_one_of_required_roles\n\n"
-                        "💡 **Tip:** Use `/config` for the new interactive configuration panel!",
-                        ephemeral=True
-                    )
-                    return
-                
-                if setting in ["view_required_roles", "view_one_of_required_roles"]:
-                    roles_handler = RequiredRolesHandler(interaction)
-                    
-                    if setting == "view_required_roles":
-                        embed = await roles_handler.view_roles("all")
-                    else:
-                        embed = await roles_handler.view_roles("one_of")
-                    
-                    await interaction.response.send_message(embed=embed, ephemeral=True)
-                elif setting in ["clear_required_roles", "clear_one_of_required_roles"]:
-                    roles_handler = RequiredRolesHandler(interaction)
-                    
-                    if setting == "clear_required_roles":
-                        embed = await roles_handler.clear_roles("all")
-                    else:
-                        embed = await roles_handler.clear_roles("one_of")
-                    
-                    await interaction.response.send_message(embed=embed)
-                else:
-                    if not value:
-                        await interaction.response.send_message(
-                            f"❌ Setting `{setting}` requires a `value` parameter (role ID or mention).",
-                            ephemeral=True
-                        )
-                        return
-                    
-                    if setting in ["add_required_role", "remove_required_role", "add_one_of_required_role", "remove_one_of_required_role"]:
-                        roles_handler = RequiredRolesHandler(interaction)
-                        
-                        if setting == "add_required_role":
-                            embed = await roles_handler.add_role("all", value)
-                        elif setting == "remove_required_role":
-                            embed = await roles_handler.remove_role("all", value)
-                        elif setting == "add_one_of_required_role":
-                            embed = await roles_handler.add_role("one_of", value)
-                        elif setting == "remove_one_of_required_role":
-                            embed = await roles_handler.remove_role("one_of", value)
-                        
-                        await interaction.response.send_message(embed=embed)
-                    else:
-                        handler = ConfigHandler(interaction)
-                        embed = await handler.handle_role_config(setting, setting.replace('_', ' ').title(), value)
-                        await interaction.response.send_message(embed=embed)
+    async def _legacy_channels(self, interaction: discord.Interaction, setting, value, action):
+        """Set a logging/notification channel."""
+        if not setting or not value:
+            await interaction.response.send_message(
+                "❌ For channel configuration, provide: `setting` and `value`\n"
+                "**Available settings:** sign_log_channel, schedule_log_channel, game_results_channel, "
+                "game_reminder_channel, demand_log_channel, blacklist_log_channel, team_owner_alert_channel, "
+                "team_announcements_channel, lft_channel\n\n"
+                "💡 **Tip:** Use `/config` for the new interactive configuration panel!",
+                ephemeral=True
+            )
+            return
+        
+        handler = ConfigHandler(interaction)
+        embed = await handler.handle_channel_config(setting, setting.replace('_', ' ').title(), value)
+        await interaction.response.send_message(embed=embed)
 
-            elif category.value == "settings":
-                if not setting or not value:
-                    await interaction.response.send_message(
-                        "❌ For settings configuration, provide: `setting` and `value`\n"
-                        "**Available settings:** team_member_cap, max_demands_allowed\n\n"
-                        "💡 **Tip:** Use `/config` for the new interactive configuration panel!",
-                        ephemeral=True
-                    )
-                    return
+    async def _legacy_roles(self, interaction: discord.Interaction, setting, value, action):
+        """Set a role or manage the required role lists."""
+        if not setting:
+            await interaction.response.send_message(
+                "❌ For role configuration, provide: `setting` and (usually) `value`\n"
+                "**Available settings:** referee_role, official_ping_role, vice_captain_role, free_agent_role, "
+                "add_required_role, remove_required_role, clear_required_roles, "
+                "add_one_of_required_role, remove_one_of_required_role, clear_one_of_required_roles, "
+                "view_required_roles, view_one_of_required_roles\n\n"
+                "💡 **Tip:** Use `/config` for the new interactive configuration panel!",
+                ephemeral=True
+            )
+            return
+        
+        if setting in _VIEW_ROLE_SETTINGS:
+            roles_handler = RequiredRolesHandler(interaction)
+            embed = await roles_handler.view_roles(ROLE_VIEWS[setting])
+            
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+        elif setting in _CLEAR_ROLE_SETTINGS:
+            roles_handler = RequiredRolesHandler(interaction)
+            embed = await roles_handler.clear_roles(ROLE_CLEARS[setting])
+            
+            await interaction.response.send_message(embed=embed)
+        else:
+            if not value:
+                await interaction.response.send_message(
+                    f"❌ Setting `{setting}` requires a `value` parameter (role ID or mention).",
+                    ephemeral=True
+                )
+                return
+            
+            if setting in _MOD_ROLE_SETTINGS:
+                roles_handler = RequiredRolesHandler(interaction)
+                role_action, scope = ROLE_ACTIONS[setting]
+                embed = await getattr(roles_handler, f"{role_action}_role")(scope, value)
                 
+                await interaction.response.send_message(embed=embed)
+            else:
                 handler = ConfigHandler(interaction)
-                embed = await handler.handle_number_config(setting, setting.replace('_', ' ').title(), value)
+                embed = await handler.handle_role_config(setting, setting.replace('_', ' ').title(), value)
                 await interaction.response.send_message(embed=embed)
 
-            elif category.value == "dashboard":
-                if not action:
-                    await interaction.response.send_message(
-                        "❌ For dashboard configuration, provide: `action`\n"
-                        "**Available actions:** setup, stop, status\n"
-                        "**For setup:** also provide `value` with channel ID\n\n"
-                        "💡 **Tip:** Use `/config` for the new interactive configuration panel!",
-                        ephemeral=True
-                    )
-                    return
-                
-                handler = ConfigHandler(interaction)
-                embed = await handler.handle_dashboard_config(action, value)
-                
-                if action == "setup":
-                    await interaction.followup.send(embed=embed)
-                else:
-                    if action == "status":
-                        await interaction.response.send_message(embed=embed, ephemeral=True)
-                    else:
-                        await interaction.response.send_message(embed=embed)
+    async def _legacy_settings(self, interaction: discord.Interaction, setting, value, action):
+        """Set a numeric setting."""
+        if not setting or not value:
+            await interaction.response.send_message(
+                "❌ For settings configuration, provide: `setting` and `value`\n"
+                "**Available settings:** team_member_cap, max_demands_allowed\n\n"
+                "💡 **Tip:** Use `/config` for the new interactive configuration panel!",
+                ephemeral=True
+            )
+            return
+        
+        handler = ConfigHandler(interaction)
+        embed = await handler.handle_number_config(setting, setting.replace('_', ' ').title(), value)
+        await interaction.response.send_message(embed=embed)
 
-        except ValueError as e:
-            if category.value == "dashboard" and action == "setup":
-                await interaction.followup.send(f"❌ {str(e)}", ephemeral=True)
-            else:
-                await interaction.response.send_message(f"❌ {str(e)}", ephemeral=True)
-        except Exception as e:
-            if category.value == "dashboard" and action == "setup":
-                await interaction.followup.send(f"❌ Error: {e}", ephemeral=True)
+    async def _legacy_dashboard(self, interaction: discord.Interaction, setting, value, action):
+        """Set up, stop or check the team owner dashboard."""
+        if not action:
+            await interaction.response.send_message(
+                "❌ For dashboard configuration, provide: `action`\n"
+                "**Available actions:** setup, stop, status\n"
+                "**For setup:** also provide `value` with channel ID\n\n"
+                "💡 **Tip:** Use `/config` for the new interactive configuration panel!",
+                ephemeral=True
+            )
+            return
+        
+        handler = ConfigHandler(interaction)
+        embed = await handler.handle_dashboard_config(action, value)
+        
+        if action == "setup":
+            await interaction.followup.send(embed=embed)
+        else:
+            if action == "status":
+                await interaction.response.send_message(embed=embed, ephemeral=True)
             else:
-                await interaction.response.send_message(f"❌ Error: {e}", ephemeral=True)
+                await interaction.response.send_message(embed=embed)
 
 async def setup(bot):
     """Setup function for the cog."""
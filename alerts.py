@@ -1,9 +1,100 @@
+import asyncio
 import discord
-from datetime import datetime
+import logging
+import time
 from database.settings import get_team_owner_alert_channel_id
+from database.teams import get_team_member_count
 from utils.emoji_helpers import get_emoji_thumbnail_url, add_team_emoji_thumbnail
 
-async def send_team_owner_alert(bot_instance, team_data, reason, additional_info=""):
+logger = logging.getLogger(__name__)
+
+ACTION_REQUIRED_TEMPLATE = "Use `/appoint user:@NewOwner team_role:{role}` to assign a new owner to this team."
+
+# Alerts raised within this window are sent together (Discord allows 10 embeds per message)
+ALERT_BATCH_WINDOW = 0.5
+MAX_EMBEDS_PER_MESSAGE = 10
+
+# Queued (channel_id, embed) pairs, each addressed to the channel resolved when it was raised
+_pending_alerts: list[tuple[int, discord.Embed]] = []
+_batch_full = asyncio.Event()
+_flush_task: asyncio.Task | None = None
+
+# Cached team owner alert channel ID; the channel itself is looked up per alert
+_alert_channel_cache: int | None = None
+
+def invalidate_alert_channel_cache():
+    """Forget the cached alert channel so the next alert re-reads the setting."""
+    global _alert_channel_cache
+    _alert_channel_cache = None
+
+async def _resolve_alert_channel(bot_instance):
+    """Get the team owner alert channel, using the cached lookup when possible."""
+    global _alert_channel_cache
+    if _alert_channel_cache is not None:
+        # Dict lookup in the bot's channel cache; None once the channel is gone
+        alert_channel = bot_instance.get_channel(_alert_channel_cache)
+        if alert_channel:
+            return alert_channel
+        _alert_channel_cache = None
+
+    alert_channel_id = await get_team_owner_alert_channel_id()
+    if not alert_channel_id or alert_channel_id == 0:
+        logger.warning("Team owner alert channel not configured")
+        return None
+    
+    # Global channel cache lookup, no need to walk every guild
+    alert_channel = bot_instance.get_channel(alert_channel_id)
+    
+    if not alert_channel:
+        logger.warning("Team owner alert channel %s not found", alert_channel_id)
+        return None
+
+    _alert_channel_cache = alert_channel_id
+    return alert_channel
+
+async def _flush_pending_alerts(bot_instance):
+    """Wait for the batch window (or a full batch), then send queued alerts."""
+    global _flush_task
+    try:
+        try:
+            await asyncio.wait_for(_batch_full.wait(), timeout=ALERT_BATCH_WINDOW)
+        except asyncio.TimeoutError:
+            pass
+        
+        while _pending_alerts:
+            _batch_full.clear()
+            # One message per channel: take the leading run of alerts bound for the same one
+            channel_id = _pending_alerts[0][0]
+            size = 1
+            while (size < min(len(_pending_alerts), MAX_EMBEDS_PER_MESSAGE)
+                   and _pending_alerts[size][0] == channel_id):
+                size += 1
+            batch = [embed for _, embed in _pending_alerts[:size]]
+            del _pending_alerts[:size]
+            
+            alert_channel = bot_instance.get_channel(channel_id)
+            if not alert_channel:
+                logger.warning("Team owner alert channel %s not found, dropping %d alert(s)", channel_id, len(batch))
+                continue
+            try:
+                await alert_channel.send(embeds=batch)
+                logger.debug("Sent %d team owner alert(s)", len(batch))
+            except Exception:
+                logger.exception("Error sending team owner alert")
+    finally:
+        _batch_full.clear()
+        _flush_task = None
+
+def _queue_alert(bot_instance, alert_channel, embed):
+    """Buffer an alert embed for its channel and make sure a flush is scheduled."""
+    global _flush_task
+    _pending_alerts.append((alert_channel.id, embed))
+    if len(_pending_alerts) >= MAX_EMBEDS_PER_MESSAGE:
+        _batch_full.set()
+    if _flush_task is None:
+        _flush_task = asyncio.create_task(_flush_pending_alerts(bot_instance))
+
+async def send_team_owner_alert(bot_instance, team_data, reason, additional_info="", member_count=None):
     """
     Send an alert when a team loses its owner
     
@@ -12,31 +103,31 @@ async def send_team_owner_alert(bot_instance, team_data, reason, additional_info
         team_data: Tuple of (team_id, role_id, emoji, name, owner_id)
         reason: Reason for losing owner (e.g., "left server", "unappointed", "role removed")
         additional_info: Additional context information
+        member_count: Signed player count, looked up from the database if not given
+    
+    Returns:
+        True if the alert was queued; it is sent in the background with the next batch
     """
+    if not team_data or len(team_data) != 5:
+        logger.error("Team owner alert got invalid team_data %r, expected 5 fields", team_data)
+        return False
+    
     try:
-        alert_channel_id = await get_team_owner_alert_channel_id()
-        if not alert_channel_id or alert_channel_id == 0:
-            print("Team owner alert channel not configured")
-            return
-        
-        # Find the channel across all guilds
-        alert_channel = None
-        for guild in bot_instance.guilds:
-            channel = guild.get_channel(alert_channel_id)
-            if channel:
-                alert_channel = channel
-                break
+        if bot_instance.is_closed():
+            return False
         
+        alert_channel = await _resolve_alert_channel(bot_instance)
         if not alert_channel:
-            print(f"Team owner alert channel {alert_channel_id} not found")
-            return
+            return False
 
         team_id, role_id, team_emoji, team_name, former_owner_id = team_data
         guild = alert_channel.guild
         
         # Get team role and current member count
         team_role = guild.get_role(role_id)
-        member_count = len(team_role.members) if team_role else 0
+        role_mention = team_role.mention if team_role else None
+        if member_count is None:
+            member_count = await get_team_member_count(team_id)
         
         # Create alert embed
         embed = discord.Embed(
@@ -54,21 +145,16 @@ async def send_team_owner_alert(bot_instance, team_data, reason, additional_info
             name="🏐 Team Details",
             value=(
                 f"**Name:** {team_emoji} {team_name}\n"
-                f"**Role:** {team_role.mention if team_role else 'Role not found'}\n"
+                f"**Role:** {role_mention or 'Role not found'}\n"
                 f"**Members:** {member_count}"
             ),
             inline=True
         )
         
-        embed.add_field(
-            name="📋 Issue Details",
-            value=(
-                f"**Reason:** {reason}\n"
-                f"**When:** <t:{int(datetime.utcnow().timestamp())}:R>"
-                + (f"\n**Info:** {additional_info}" if additional_info else "")
-            ),
-            inline=True
-        )
+        details = [f"**Reason:** {reason}", f"**When:** <t:{int(time.time())}:R>"]
+        if additional_info:
+            details.append(f"**Info:** {additional_info}")
+        embed.add_field(name="📋 Issue Details", value="\n".join(details), inline=True)
         
         # Add former owner info if available
         if former_owner_id:
@@ -88,18 +174,16 @@ async def send_team_owner_alert(bot_instance, team_data, reason, additional_info
         
         embed.add_field(
             name="🛠️ Action Required",
-            value=(
-                f"Use `/appoint user:@NewOwner team_role:{team_role.mention if team_role else '@TeamRole'}` "
-                f"to assign a new owner to this team."
-            ),
+            value=ACTION_REQUIRED_TEMPLATE.format(role=role_mention or '@TeamRole'),
             inline=False
         )
         
         embed.set_footer(text="Team Owner Alert System")
         embed.timestamp = discord.utils.utcnow()
         
-        await alert_channel.send(embed=embed)
-        print(f"Sent team owner alert for {team_name}")
+        _queue_alert(bot_instance, alert_channel, embed)
+        return True
         
-    except Exception as e:
-        print(f"Error sending team owner alert: {e}")
\ No newline at end of file
+    except Exception:
+        logger.exception("Error sending team owner alert")
+        return False
\ No newline at end of file
@@ -1,25 +1,1026 @@
+import asyncio
+import aiosqlite
+import bisect
 import discord
+import functools
+import io
+import json
+import os
+import re
+import time
+from contextlib import asynccontextmanager
+from types import MappingProxyType
 from discord import app_commands
 from discord.ext import commands
-from datetime import datetime, timedelta
-from config import ALLOWED_MANAGEMENT_ROLES
+from datetime import datetime, timedelta, timezone
+from config import ALLOWED_MANAGEMENT_ROLES, DB_PATH
+
+try:
+    import psutil
+    psutil.cpu_percent(interval=None)  # Prime the non-blocking CPU sampler
+except ImportError:
+    psutil = None
 
 # Import the audit logging functions
 try:
-    from cog.audit_logging import get_audit_settings, save_audit_settings, log_audit_event
+    from cog.audit_logging import (get_audit_settings, save_audit_settings, toggle_audit_settings, log_audit_event,
+                                   format_duration, FEATURE_FLAG_KEYS, AUDIT_EVENT_TYPES)
 except ImportError:
     # Fallback imports if not in cog directory
-    from audit_logging import get_audit_settings, save_audit_settings, log_audit_event
+    from audit_logging import (get_audit_settings, save_audit_settings, toggle_audit_settings, log_audit_event,
+                               format_duration, FEATURE_FLAG_KEYS, AUDIT_EVENT_TYPES)
+
+# ========================= SHARED DATABASE CONNECTION =========================
+
+DB_POOL_SIZE = 4
+
+_db_pool = None
+_db_lock = asyncio.Lock()
+
+async def _open_pooled_connection():
+    """Open a long-lived connection tuned for the dashboard reads."""
+    db = await aiosqlite.connect(DB_PATH)
+    await db.execute("PRAGMA journal_mode=WAL")
+    await db.execute("PRAGMA synchronous=NORMAL")
+    await db.execute("PRAGMA cache_size=-20000")
+    await db.execute("PRAGMA mmap_size=268435456")
+    await db.execute("PRAGMA temp_store=MEMORY")
+    return db
+
+async def _get_db_pool():
+    """Lazily open the pool of aiosqlite connections used by the audit panels."""
+    global _db_pool
+    if _db_pool is None:
+        async with _db_lock:
+            if _db_pool is None:
+                pool = asyncio.Queue()
+                for _ in range(DB_POOL_SIZE):
+                    pool.put_nowait(await _open_pooled_connection())
+                _db_pool = pool
+    return _db_pool
+
+@asynccontextmanager
+async def db_connection():
+    """Borrow a pooled connection for the duration of the block."""
+    pool = await _get_db_pool()
+    db = await pool.get()
+    try:
+        yield db
+    finally:
+        # A pool closed while this connection was out can't take it back
+        if _db_pool is pool:
+            pool.put_nowait(db)
+        else:
+            await db.close()
+
+async def close_db_pool():
+    """Close every idle pooled connection (called when the cog unloads); borrowed ones close on return."""
+    global _db_pool
+    pool, _db_pool = _db_pool, None
+    while pool is not None and not pool.empty():
+        await pool.get_nowait().close()
+
+async def fetch_all(query: str, params=(), db=None):
+    """Run a read query on `db`, or a pooled connection, and return all rows."""
+    if db is not None:
+        async with db.execute(query, params) as cursor:
+            return await cursor.fetchall()
+    async with db_connection() as db:
+        async with db.execute(query, params) as cursor:
+            return await cursor.fetchall()
+
+def _cutoff_iso(days: int = 0, hours: int = 0) -> str:
+    """ISO timestamp `days` and `hours` ago, naive UTC to match the stored audit_logs timestamps."""
+    seconds = time.time() - days * 86400 - hours * 3600
+    return datetime.fromtimestamp(seconds, timezone.utc).replace(tzinfo=None).isoformat()
+
+# Maintenance panel counts per guild: guild_id -> (taken_at, retention_days, (total, old))
+LOG_COUNTS_TTL = 20
+_log_counts_cache = {}
+# In-flight count queries, shared by concurrent callers: (guild_id, retention_days) -> Task
+_log_counts_inflight = {}
+
+async def get_log_counts(guild_id: int, retention_days: int, db=None):
+    """Total and past-retention record counts for a guild, cached for LOG_COUNTS_TTL seconds."""
+    cached = _log_counts_cache.get(guild_id)
+    now = time.monotonic()
+    if cached and cached[1] == retention_days and now - cached[0] < LOG_COUNTS_TTL:
+        return cached[2]
+    
+    # A caller's own connection is only valid while that caller runs, so it
+    # can't back a query other callers share
+    if db is not None:
+        return await _query_log_counts(guild_id, retention_days, db)
+    
+    # Concurrent presses on a cold cache wait on one query, which borrows
+    # its own pooled connection so a cancelled caller can't pull it away
+    key = (guild_id, retention_days)
+    task = _log_counts_inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_query_log_counts(guild_id, retention_days))
+        _log_counts_inflight[key] = task
+        task.add_done_callback(lambda _: _log_counts_inflight.pop(key, None))
+    return await asyncio.shield(task)
+
+async def _query_log_counts(guild_id: int, retention_days: int, db=None):
+    """Run the count query behind get_log_counts and cache the result."""
+    # Total comes from the trigger-maintained counter; old records are an
+    # index range count, which stays small because cleanup purges them daily
+    cutoff = _cutoff_iso(retention_days)
+    rows = await fetch_all("""
+        SELECT (SELECT total FROM audit_counters WHERE guild_id = ?),
+               (SELECT COUNT(*) FROM audit_logs WHERE guild_id = ? AND timestamp < ?)
+    """, (guild_id, guild_id, cutoff), db)
+    total, old = rows[0]
+    if total is None:
+        total = (await fetch_all("SELECT COUNT(*) FROM audit_logs WHERE guild_id = ?", (guild_id,), db))[0][0]
+    counts = (total, old)
+    _log_counts_cache[guild_id] = (time.monotonic(), retention_days, counts)
+    return counts
+
+# Dashboard stats: (field, guild_id) -> (taken_at, value); rendered fields plus the shared counts
+DASHBOARD_STATS_TTL = 30
+_dashboard_stats_cache = {}
+
+def cached_dashboard_stat(field: str, guild_id: int):
+    """A dashboard stat taken within the last DASHBOARD_STATS_TTL seconds, or None."""
+    cached = _dashboard_stats_cache.get((field, guild_id))
+    if cached and time.monotonic() - cached[0] < DASHBOARD_STATS_TTL:
+        return cached[1]
+    return None
+
+def cache_dashboard_stat(field: str, guild_id: int, value):
+    """Remember a dashboard stat and return it."""
+    _dashboard_stats_cache[(field, guild_id)] = (time.monotonic(), value)
+    return value
+
+async def get_dashboard_counts(guild_id: int):
+    """(total events, last-24h events, query ms) for the dashboard, in one round trip.
+    
+    Both the performance and statistics fields read these, so the second one is a cache hit.
+    """
+    cached = cached_dashboard_stat('counts', guild_id)
+    if cached is not None:
+        return cached
+    
+    # Total from the trigger-maintained counter, last 24h from the hourly
+    # ring: key lookups however large the guild's log is
+    first_hour = int(time.time()) // 3600 - 23
+    start_time = time.perf_counter()
+    rows = await fetch_all("""
+        SELECT (SELECT total FROM audit_counters WHERE guild_id = ?),
+               (SELECT SUM(events) FROM audit_hourly_counts WHERE guild_id = ? AND hour >= ?)
+    """, (guild_id, guild_id, first_hour))
+    query_time = (time.perf_counter() - start_time) * 1000
+    total, recent = rows[0]
+    return cache_dashboard_stat('counts', guild_id, (total or 0, recent or 0, query_time))
+
+# Server size buckets by member count: < 50, < 500, and the rest
+_SERVER_SIZE_THRESHOLDS = (50, 500)
+_SERVER_SIZE_LABELS = ("Small", "Medium", "Large")
+
+# Retention analysis tiers: (indicator, assessment, recommendation) for
+# <= 7, <= 30, <= 90 and longer retention periods
+_RETENTION_THRESHOLDS = (7, 30, 90)
+_RETENTION_TIERS = (
+    ("🟡", "⚠️ **Short-term retention** - Good for testing or high-activity servers",
+     "Consider 14-30 days for better trend analysis"),
+    ("🟢", "✅ **Standard retention** - Excellent balance of storage and utility",
+     "Optimal for most servers"),
+    ("🔵", "📊 **Extended retention** - Great for compliance and detailed analysis",
+     "Perfect for servers requiring detailed audit trails"),
+    ("🟣", "🗄️ **Long-term retention** - Maximum data preservation",
+     "Monitor storage usage regularly"),
+)
+
+# Setup-modal feature defaults by server size; medium and large servers share one set
+_SMART_DEFAULTS_SMALL = MappingProxyType({
+    # Small server - enable everything for detailed monitoring
+    'log_members': True, 'log_roles': True, 'log_avatars': True,
+    'log_voice': True, 'log_messages': True, 'log_server': True,
+    'log_moderation': True, 'log_stage': True
+})
+_SMART_DEFAULTS_MEDIUM_LARGE = MappingProxyType({
+    # Medium and large servers - focus on important events
+    'log_members': True, 'log_roles': True, 'log_avatars': False,
+    'log_voice': False, 'log_messages': True, 'log_server': True,
+    'log_moderation': True, 'log_stage': False
+})
+
+# Strong references to fire-and-forget tasks so they aren't collected mid-flight
+_background_tasks = set()
+
+# ========================= FEATURE TABLES =========================
+
+_FEATURE_KEYS = FEATURE_FLAG_KEYS
+_FEATURE_BITS = {key: 1 << i for i, key in enumerate(_FEATURE_KEYS)}
+
+# Features embed: (field name, ((label, setting key), ...))
+_FEATURE_FIELDS = (
+    ("👥 Member Tracking", (("Joins/Leaves", 'log_members'), ("Role Changes", 'log_roles'),
+                           ("Avatar Changes", 'log_avatars'))),
+    ("🔨 Moderation", (("Bans/Kicks/Timeouts", 'log_moderation'), ("Voice Disconnects", 'log_voice'))),
+    ("💬 Communication", (("Message Events", 'log_messages'), ("Voice Activity", 'log_voice'),
+                         ("Channel Events", 'log_server'), ("Stage Events", 'log_stage'))),
+)
+
+# Feature toggle buttons: (emoji, label, setting keys, row)
+_FEATURE_LAYOUT = (
+    # Row 0: Core features
+    ("👥", "Members", ('log_members', 'log_avatars'), 0),
+    ("🎭", "Roles", ('log_roles',), 0),
+    ("🔊", "Voice", ('log_voice',), 0),
+    # Row 1: Communication features
+    ("💬", "Messages", ('log_messages',), 1),
+    ("📋", "Server", ('log_server',), 1),
+    ("🔨", "Moderation", ('log_moderation',), 1),
+)
+
+# Status dashboard feature matrix: (label, setting key)
+_FEATURE_LABELS = (
+    ("👥 Member Events", 'log_members'),
+    ("🎭 Role Changes", 'log_roles'),
+    ("🔊 Voice Activity", 'log_voice'),
+    ("💬 Messages", 'log_messages'),
+    ("🔨 Moderation", 'log_moderation'),
+    ("📋 Server Events", 'log_server'),
+    ("🎙️ Stage Events", 'log_stage'),
+    ("🖼️ Avatar Changes", 'log_avatars'),
+)
+
+# Static scaffolding for the features embed; copied per render
+_FEATURES_EMBED_TEMPLATE = discord.Embed.from_dict({
+    "title": "⚙️ Audit Logging Features",
+    "description": "**Advanced event monitoring and logging system**\n\nClick the buttons below to toggle features:",
+    "color": discord.Color.blue().value,
+    "footer": {"text": "Changes are saved automatically • Use buttons below to toggle features"},
+})
+
+# Disable confirmation prompt; never mutated, so sent as-is
+_DISABLE_PROMPT_EMBED = discord.Embed.from_dict({
+    "title": "⚠️ Disable Audit Logging",
+    "description": "**Are you sure you want to disable audit logging?**\n\nThis will stop all event monitoring and logging.",
+    "color": discord.Color.orange().value,
+    "fields": [{
+        "name": "🔄 What happens when disabled:",
+        "value": "• No new events will be logged\n• Existing logs will be kept\n• System can be re-enabled anytime\n• All settings will be preserved",
+        "inline": False,
+    }],
+})
+
+# Disable confirmation outcomes; the disabled one is copied per send for its footer and timestamp
+_DISABLED_EMBED_TEMPLATE = discord.Embed.from_dict({
+    "title": "🔴 Audit Logging System Disabled",
+    "description": "**The audit logging system has been successfully disabled.**\n\nAll event monitoring has been stopped.",
+    "color": discord.Color.red().value,
+    "fields": [
+        {
+            "name": "🔄 What happened:",
+            "value": (
+                "• Event monitoring stopped immediately\n"
+                "• No new logs will be created\n"
+                "• Existing data remains intact\n"
+                "• All settings have been preserved"
+            ),
+            "inline": False,
+        },
+        {
+            "name": "💡 To re-enable:",
+            "value": "Run `/auditconfig` and use the **🚀 Setup Now** button to restore functionality.",
+            "inline": False,
+        },
+    ],
+})
+_DISABLE_CANCELLED_EMBED = discord.Embed.from_dict({
+    "title": "✅ Action Cancelled",
+    "description": "**Audit logging remains active.**\n\nNo changes have been made to your configuration.",
+    "color": discord.Color.green().value,
+    "fields": [{
+        "name": "🔍 System Status",
+        "value": "All monitoring features continue to operate normally.",
+        "inline": False,
+    }],
+})
+
+# JSON keys for the export columns, in SELECT order
+_EXPORT_COLUMNS = ('type', 'user', 'target', 'moderator', 'timestamp', 'channel', 'reason', 'before', 'after')
+
+# /auditlogs row emoji by event type
+_EVENT_EMOJI = {
+    "member_join": "👋", "member_leave": "👋", "member_ban": "🔨",
+    "member_kick": "🦵", "role_add": "➕", "role_remove": "➖",
+    "message_delete": "🗑️", "message_edit": "📝", "voice_join": "🔊",
+    "voice_disconnect": "🔌", "avatar_change": "🖼️"
+}
+
+# Event types whose /auditlogs rows preview the before/after content
+_CONTENT_PREVIEW_EVENTS = frozenset({'message_delete', 'message_edit', 'avatar_change'})
+
+@functools.lru_cache(maxsize=128)
+def _pretty_event(event_type: str) -> str:
+    """Display name for an event type, e.g. member_join -> Member Join."""
+    return event_type.replace('_', ' ').title()
+
+def _truncate(value, limit: int) -> str:
+    """str(value) cut to `limit` characters, with '...' when anything was cut."""
+    text = str(value)
+    return text[:limit] + '...' if len(text) > limit else text
+
+# Log search rows rendered; one more is fetched only to tell whether there are more
+SEARCH_RESULTS_SHOWN = 10
+
+# Log search forms: a bare word (exact name first), name* (prefix) or "exact phrase"
+_BARE_WORD_RE = re.compile(r"[^\s*\"]+")
+_NAME_EQUALS_PREDICATE = "AND (user_name = ? COLLATE NOCASE OR target_name = ? COLLATE NOCASE OR moderator_name = ? COLLATE NOCASE)"
+_NAME_PREFIX_PREDICATE = (
+    "AND ((user_name >= ? COLLATE NOCASE AND user_name < ? COLLATE NOCASE)"
+    " OR (target_name >= ? COLLATE NOCASE AND target_name < ? COLLATE NOCASE)"
+    " OR (moderator_name >= ? COLLATE NOCASE AND moderator_name < ? COLLATE NOCASE))"
+)
+_FTS_PREDICATE = "AND id IN (SELECT rowid FROM audit_logs_fts WHERE audit_logs_fts MATCH ?)"
+_LIKE_PREDICATE = "AND (user_name LIKE ? OR target_name LIKE ? OR moderator_name LIKE ? OR before_value LIKE ? OR after_value LIKE ?)"
+
+def _fts_query(term: str) -> str:
+    """FTS5 query for a search term: "quoted" is an exact phrase, anything else
+    a phrase whose last token matches as a prefix."""
+    if len(term) > 1 and term[0] == term[-1] == '"':
+        return '"' + term[1:-1].replace('"', '""') + '"'
+    return '"' + term.rstrip('*').replace('"', '""') + '"*'
+
+@functools.lru_cache(maxsize=128)
+def _search_sql(predicate: str, has_date: bool, event_count: int) -> str:
+    """SQL for one log-search shape; built once per shape so the connection's
+    statement cache keeps reusing the same prepared statement."""
+    query_parts = ["SELECT id, event_type, user_name, target_name, moderator_name, ts_epoch, before_value, after_value FROM audit_logs WHERE guild_id = ?", predicate]
+    if has_date:
+        query_parts.append("AND timestamp >= ?")
+    if event_count:
+        query_parts.append(f"AND event_type IN ({','.join('?' * event_count)})")
+    query_parts.append(f"ORDER BY timestamp DESC LIMIT {SEARCH_RESULTS_SHOWN + 1}")
+    return ' '.join(query_parts)
+
+# /auditlogs SQL by (event type filter, user filter). Only content events have
+# their before/after values previewed, so the rest leave those columns unread
+_CONTENT_PREVIEW_SQL = ', '.join(f"'{event}'" for event in sorted(_CONTENT_PREVIEW_EVENTS))
+_FILTERED_LOGS_SQL = {
+    (has_event_type, has_user): ' '.join(filter(None, (
+        "SELECT event_type, user_name, target_name, moderator_name, ts_epoch,"
+        f" CASE WHEN event_type IN ({_CONTENT_PREVIEW_SQL}) THEN before_value END,"
+        f" CASE WHEN event_type IN ({_CONTENT_PREVIEW_SQL}) THEN after_value END"
+        " FROM audit_logs WHERE guild_id = ?",
+        "AND event_type = ?" if has_event_type else "",
+        "AND (user_id = ? OR target_id = ?)" if has_user else "",
+        "ORDER BY timestamp DESC LIMIT ?",
+    )))
+    for has_event_type in (False, True)
+    for has_user in (False, True)
+}
+
+# NOCASE only folds ASCII letters, so the range bounds must be folded the same way
+_ASCII_LOWER = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+
+def _prefix_range(prefix: str):
+    """(low, high) bounds such that x >= low AND x < high under NOCASE means x starts with prefix,
+    or None when no such bounds exist (a trailing '@' would step to 'A', which NOCASE reads as 'a')."""
+    low = prefix.translate(_ASCII_LOWER)
+    high = chr(ord(low[-1]) + 1)
+    if 'A' <= high <= 'Z':
+        return None
+    return low, low[:-1] + high
+
+# Channel reference typed into the setup modal: <#id>, a bare id, or a #name
+_CHANNEL_REF_RE = re.compile(r"<#(\d+)>|(\d+)|#*(.+)")
+
+# Permissions the setup modal requires on the audit channel: (flag bit, display name)
+_SETUP_CHANNEL_PERMISSIONS = tuple(
+    (discord.Permissions(**{flag: True}).value, display_name)
+    for flag, display_name in (
+        ('view_channel', 'View Channel'),
+        ('send_messages', 'Send Messages'),
+        ('embed_links', 'Embed Links'),
+        ('read_message_history', 'Read Message History'),
+        ('attach_files', 'Attach Files'),
+        ('use_external_emojis', 'Use External Emojis'),
+    )
+)
+_SETUP_CHANNEL_MASK = sum(bit for bit, _ in _SETUP_CHANNEL_PERMISSIONS)
+
+# Channel permissions the audit log channel needs, as a bitmask
+_NEEDED_LOG_PERMISSIONS = discord.Permissions(send_messages=True, embed_links=True).value
+
+# CPU usage sample reused for a few seconds: (taken_at, percent)
+CPU_SAMPLE_TTL = 5
+_cpu_sample = (0.0, 0.0)
+
+def cpu_percent() -> float:
+    """Non-blocking CPU usage since the previous sample, cached briefly."""
+    global _cpu_sample
+    now = time.monotonic()
+    if now - _cpu_sample[0] >= CPU_SAMPLE_TTL:
+        _cpu_sample = (now, psutil.cpu_percent(interval=None))
+    return _cpu_sample[1]
+
+# Database file size reused for a while: (taken_at, size in MB)
+BYTES_PER_MB = 1048576
+DB_SIZE_TTL = 30
+_db_size_sample = (0.0, 0.0)
+
+def db_size_mb() -> float:
+    """Size of the database file in MB, re-read at most every DB_SIZE_TTL seconds."""
+    global _db_size_sample
+    now = time.monotonic()
+    if now - _db_size_sample[0] >= DB_SIZE_TTL:
+        size = os.stat(DB_PATH).st_size
+        try:
+            # Uncheckpointed pages live in the WAL file
+            size += os.stat(f"{DB_PATH}-wal").st_size
+        except FileNotFoundError:
+            pass
+        _db_size_sample = (now, size / BYTES_PER_MB)
+    return _db_size_sample[1]
+
+def feature_mask(settings: dict) -> int:
+    """Pack the feature flags into an int, one bit per _FEATURE_KEYS entry."""
+    if settings.get('feature_mask') is not None:
+        return settings['feature_mask']
+    mask = 0
+    for i, key in enumerate(_FEATURE_KEYS):
+        mask |= bool(settings.get(key, True)) << i
+    return mask
+
+# Preset configurations, by dropdown value
+_PRESETS = {
+    "basic": {
+        "log_members": True, "log_moderation": True,
+        "log_roles": False, "log_avatars": False,
+        "log_voice": False, "log_messages": False, 
+        "log_server": False, "log_stage": False
+    },
+    "standard": {
+        "log_members": True, "log_roles": True, "log_avatars": False,
+        "log_moderation": True, "log_voice": False, 
+        "log_messages": True, "log_server": False, "log_stage": False
+    },
+    "comprehensive": {
+        "log_members": True, "log_roles": True, "log_avatars": True,
+        "log_moderation": True, "log_voice": True, 
+        "log_messages": True, "log_server": True, "log_stage": True
+    },
+    "moderation": {
+        "log_members": True, "log_roles": True, "log_avatars": False,
+        "log_moderation": True, "log_voice": True,
+        "log_messages": True, "log_server": False, "log_stage": False
+    },
+    "community": {
+        "log_members": True, "log_roles": True, "log_avatars": True,
+        "log_moderation": False, "log_voice": True, 
+        "log_messages": False, "log_server": False, "log_stage": True
+    },
+    "security": {
+        "log_members": True, "log_roles": True, "log_avatars": True,
+        "log_moderation": True, "log_voice": True,
+        "log_messages": True, "log_server": True, "log_stage": False
+    }
+}
+
+_PRESET_NAMES = {
+    "basic": "Basic Monitoring",
+    "standard": "Standard Configuration", 
+    "comprehensive": "Comprehensive Tracking",
+    "moderation": "Moderation Focus",
+    "community": "Community Focus",
+    "security": "Security Focus"
+}
+
+_PRESET_FEATURE_NAMES = {
+    "log_members": "Member Events",
+    "log_roles": "Role Changes", 
+    "log_avatars": "Avatar Changes",
+    "log_moderation": "Moderation Actions",
+    "log_voice": "Voice Activity",
+    "log_messages": "Message Events",
+    "log_server": "Server Events",
+    "log_stage": "Stage Events"
+}
+
+_PRESET_DESCRIPTIONS = {
+    "basic": "Essential monitoring with minimal noise",
+    "standard": "Balanced configuration for most servers",
+    "comprehensive": "Complete visibility into all server activity",
+    "moderation": "Focused on staff actions and enforcement",
+    "community": "Emphasizes member engagement and activity",
+    "security": "Enhanced monitoring for potential threats"
+}
+
+def _feature_bullets(mask: int, enabled: bool) -> str:
+    """Bullet list of the features whose bit in mask matches enabled ('' if none)."""
+    names = [_PRESET_FEATURE_NAMES[key] for key in _FEATURE_KEYS if bool(mask & _FEATURE_BITS[key]) == enabled]
+    return "• " + "\n• ".join(names) if names else ""
+
+# Preset -> feature bitmask; bitmask -> preformatted (enabled, disabled) bullet lists
+_PRESET_MASKS = {preset: feature_mask(flags) for preset, flags in _PRESETS.items()}
+_PRESET_SUMMARIES = {
+    mask: (_feature_bullets(mask, True), _feature_bullets(mask, False))
+    for mask in set(_PRESET_MASKS.values())
+}
 
 # ========================= PERMISSION CHECK =========================
 
-def check_permissions(user, roles_list):
+_ALLOWED_MANAGEMENT_ROLES = frozenset(ALLOWED_MANAGEMENT_ROLES)
+
+def check_permissions(user, roles_list=ALLOWED_MANAGEMENT_ROLES):
     """Simple synchronous permission check."""
-    user_roles = [role.name for role in user.roles]
-    return any(role in user_roles for role in roles_list)
+    allowed = _ALLOWED_MANAGEMENT_ROLES if roles_list is ALLOWED_MANAGEMENT_ROLES else frozenset(roles_list)
+    return not allowed.isdisjoint(role.name for role in user.roles)
+
+# ========================= STATIC EMBEDS =========================
+
+# Help guide embed payload, fed to Embed.from_dict
+_HELP_PAYLOAD = {
+    "title": "🆘 Comprehensive Audit Logging Guide",
+    "description": "**Everything you need to know about the audit logging system**",
+    "color": discord.Color.blue().value,
+    "fields": [
+        {
+            "name": "🚀 Quick Start",
+            "value": (
+                "1. **Setup:** Use 🚀 Setup Now to configure a channel\n"
+                "2. **Features:** Toggle what events to monitor\n"
+                "3. **Test:** Verify everything works correctly\n"
+                "4. **Monitor:** Check analytics and performance"
+            ),
+            "inline": False,
+        },
+        {
+            "name": "🔍 Advanced Features",
+            "value": (
+                "**🕵️ Smart Detection:** Automatically identifies moderators\n"
+                "**⏱️ Voice Tracking:** Monitors session durations\n"
+                "**💾 Content Preservation:** Saves deleted messages\n"
+                "**🔌 Disconnect Detection:** Tracks voice disconnects\n"
+                "**🖼️ Avatar Tracking:** Monitors avatar changes\n"
+                "**📊 Analytics:** Comprehensive usage statistics\n"
+                "**🔍 Search:** Find specific events quickly\n"
+                "**📥 Export:** Data export in multiple formats"
+            ),
+            "inline": False,
+        },
+        {
+            "name": "⚙️ Configuration Tips",
+            "value": (
+                "• **Channel Setup:** Use a dedicated audit channel\n"
+                "• **Permissions:** Ensure bot can view audit logs\n"
+                "• **Retention:** 30-90 days recommended\n"
+                "• **Features:** Enable only what you need\n"
+                "• **Testing:** Regular system health checks"
+            ),
+            "inline": False,
+        },
+        {
+            "name": "🎯 Event Types",
+            "value": (
+                "**👥 Members:** Joins, leaves, role changes, nicknames, avatars\n"
+                "**🔨 Moderation:** Bans, kicks, mutes, disconnects with reasons\n"
+                "**🔊 Voice:** Channel activity, session tracking, disconnects\n"
+                "**💬 Messages:** Edits, deletions with full content\n"
+                "**📋 Server:** Channel and role modifications\n"
+                "**🎙️ Stage:** Speaker/listener changes with context"
+            ),
+            "inline": False,
+        },
+        {
+            "name": "📊 Analytics Features",
+            "value": (
+                "• **Activity Trends:** Track server engagement\n"
+                "• **User Statistics:** Most active members\n"
+                "• **Event Breakdown:** Popular action types\n"
+                "• **Performance Metrics:** System health\n"
+                "• **Custom Reports:** Export filtered data"
+            ),
+            "inline": False,
+        },
+        {
+            "name": "🔧 Troubleshooting",
+            "value": (
+                "**No logs?** Check channel permissions\n"
+                "**Missing moderator?** Enable 'View Audit Log' permission\n"
+                "**High usage?** Disable unused features\n"
+                "**Performance issues?** Check system metrics\n"
+                "**Data concerns?** Adjust retention period"
+            ),
+            "inline": False,
+        },
+    ],
+    "footer": {"text": "Need more help? Use the various dashboard features to explore!"},
+}
+
+def _build_advanced_config_embed():
+    """Build the static advanced configuration panel embed."""
+    embed = discord.Embed(
+        title="🎛️ Advanced Configuration",
+        description="**Fine-tune your audit logging system**\n\nAdvanced settings for power users:",
+        color=discord.Color.blue()
+    )
+        
+    embed.add_field(
+        name="🔍 Detection Settings",
+        value=(
+            "• **Moderator Detection:** Advanced AI-powered detection\n"
+            "• **Disconnect Detection:** Tracks voice channel disconnects\n"
+            "• **Bulk Action Detection:** Identifies mass operations\n"
+            "• **Spam Filter:** Reduces noise from repeated actions\n"
+            "• **Context Analysis:** Enhanced event correlation"
+        ),
+        inline=False
+    )
+        
+    embed.add_field(
+        name="⚡ Performance Tuning",
+        value=(
+            "• **Batch Processing:** Groups related events\n"
+            "• **Smart Caching:** Reduces database queries\n"
+            "• **Rate Limiting:** Prevents system overload\n"
+            "• **Async Processing:** Non-blocking operations"
+        ),
+        inline=False
+    )
+        
+    embed.add_field(
+        name="🎯 Accuracy Enhancements",
+        value=(
+            "• **Double Verification:** Cross-checks audit logs\n"
+            "• **Timestamp Precision:** Microsecond accuracy\n"
+            "• **Event Deduplication:** Removes duplicate entries\n"
+            "• **Error Correction:** Auto-fixes common issues"
+        ),
+        inline=False
+    )
+        
+    embed.add_field(
+        name="🛡️ Security Features",
+        value=(
+            "• **Tamper Detection:** Monitors log integrity\n"
+            "• **Access Logging:** Tracks who views logs\n"
+            "• **Encryption:** Secure data storage\n"
+            "• **Audit Trail:** Comprehensive change tracking"
+        ),
+        inline=False
+    )
+        
+    embed.set_footer(text="These advanced features are automatically optimized for your server")
+    
+    return embed
+
+def _build_event_filters_embed():
+    """Build the static event filters panel embed."""
+    embed = discord.Embed(
+        title="🔍 Event Filters",
+        description="**Configure intelligent event filtering**\n\nReduce noise and focus on important events:",
+        color=discord.Color.blue()
+    )
+        
+    embed.add_field(
+        name="🎯 Smart Filters",
+        value=(
+            "• **Bot Activity Filter:** Hide bot-generated events\n"
+            "• **Bulk Action Filter:** Consolidate mass operations\n"
+            "• **Spam Reduction:** Limit repeated similar events\n"
+            "• **Time-based Grouping:** Merge rapid-fire actions"
+        ),
+        inline=False
+    )
+        
+    embed.add_field(
+        name="👥 User Filters",
+        value=(
+            "• **Role-based Filtering:** Focus on specific roles\n"
+            "• **VIP Monitoring:** Enhanced tracking for important users\n"
+            "• **New Member Focus:** Extra attention to recent joins\n"
+            "• **Staff Action Tracking:** Detailed moderator monitoring"
+        ),
+        inline=False
+    )
+        
+    embed.add_field(
+        name="⏰ Time Filters",
+        value=(
+            "• **Peak Hours:** Increased sensitivity during busy times\n"
+            "• **Quiet Periods:** Reduced monitoring during low activity\n"
+            "• **Event Scheduling:** Custom monitoring windows\n"
+            "• **Historical Analysis:** Pattern-based filtering"
+        ),
+        inline=False
+    )
+        
+    embed.add_field(
+        name="📊 Current Filter Status",
+        value=(
+            "✅ **Smart Deduplication:** Active\n"
+            "✅ **Bot Filtering:** Active\n"
+            "✅ **Spam Reduction:** Active\n"
+            "✅ **Performance Optimization:** Active"
+        ),
+        inline=False
+    )
+        
+    embed.set_footer(text="Filters are intelligently applied to improve signal-to-noise ratio")
+    
+    return embed
+
+def _build_custom_reports_embed():
+    """Build the static custom reports panel embed."""
+    embed = discord.Embed(
+        title="📊 Custom Reports",
+        description="**Generate detailed audit reports**\n\nCreate comprehensive analysis of your server activity:",
+        color=discord.Color.blue()
+    )
+        
+    embed.add_field(
+        name="📈 Available Reports",
+        value=(
+            "• **Activity Summary:** Daily/weekly/monthly overviews\n"
+            "• **User Behavior Analysis:** Individual user patterns\n"
+            "• **Moderation Report:** Staff action summary\n"
+            "• **Security Audit:** Potential security concerns\n"
+            "• **Growth Analysis:** Member join/leave trends\n"
+            "• **Voice Activity Report:** Call statistics\n"
+            "• **Avatar Change Report:** Visual history tracking"
+        ),
+        inline=False
+    )
+        
+    embed.add_field(
+        name="🎯 Report Features",
+        value=(
+            "• **Custom Date Ranges:** Specify exact periods\n"
+            "• **Multiple Formats:** Text, charts, CSV export\n"
+            "• **Automated Generation:** Scheduled reports\n"
+            "• **Filtered Data:** Focus on specific events\n"
+            "• **Comparative Analysis:** Compare time periods\n"
+            "• **Trend Identification:** Spot patterns"
+        ),
+        inline=False
+    )
+        
+    embed.add_field(
+        name="⚡ Quick Reports",
+        value=(
+            "• **Last 24 Hours:** Recent activity snapshot\n"
+            "• **This Week:** Weekly activity summary\n"
+            "• **Top Users:** Most active members\n"
+            "• **Recent Joins:** New member overview\n"
+            "• **Moderation Actions:** Staff activity log\n"
+            "• **Voice Statistics:** Call duration analysis\n"
+            "• **Avatar Changes:** Recent profile updates"
+        ),
+        inline=False
+    )
+        
+    embed.add_field(
+        name="📋 Sample Report Data",
+        value=(
+            "```\n"
+            "📊 Weekly Activity Report\n"
+            "• Total Events: 1,247\n"
+            "• New Members: 23\n"
+            "• Messages Deleted: 156\n"
+            "• Role Changes: 89\n"
+            "• Voice Sessions: 445\n"
+            "• Avg Session: 24m\n"
+            "• Avatar Changes: 12\n"
+            "• Disconnects: 8\n"
+            "```"
+        ),
+        inline=False
+    )
+        
+    embed.set_footer(text="Reports can be generated on-demand or scheduled automatically")
+    
+    return embed
+
+def _build_import_export_embed():
+    """Build the static import/export panel embed."""
+    embed = discord.Embed(
+        title="⚙️ Import/Export Tools",
+        description="**Backup and restore your audit configuration**\n\nPowerful tools for configuration management:",
+        color=discord.Color.blue()
+    )
+        
+    embed.add_field(
+        name="📤 Export Options",
+        value=(
+            "• **Configuration Backup:** Full settings export\n"
+            "• **Audit Data Export:** Historical log data\n"
+            "• **Custom Reports:** Formatted analysis\n"
+            "• **Statistics Export:** Performance metrics\n"
+            "• **Schema Export:** Database structure\n"
+            "• **Filtered Exports:** Specific date ranges"
+        ),
+        inline=False
+    )
+        
+    embed.add_field(
+        name="📥 Import Options",
+        value=(
+            "• **Configuration Restore:** Apply saved settings\n"
+            "• **Bulk Configuration:** Setup multiple servers\n"
+            "• **Migration Tools:** Transfer between bots\n"
+            "• **Template Import:** Use predefined configs\n"
+            "• **Selective Import:** Choose specific settings\n"
+            "• **Merge Configurations:** Combine settings"
+        ),
+        inline=False
+    )
+        
+    embed.add_field(
+        name="📋 Export Formats",
+        value=(
+            "• **JSON:** Machine-readable configuration\n"
+            "• **CSV:** Spreadsheet-compatible data\n"
+            "• **TXT:** Human-readable reports\n"
+            "• **XML:** Structured data format\n"
+            "• **SQL:** Database dump format\n"
+            "• **YAML:** Configuration file format"
+        ),
+        inline=True
+    )
+        
+    embed.add_field(
+        name="🔒 Security Features",
+        value=(
+            "• **Encryption:** Secure sensitive data\n"
+            "• **Access Control:** Permission-based exports\n"
+            "• **Audit Trail:** Track import/export actions\n"
+            "• **Validation:** Verify data integrity\n"
+            "• **Sanitization:** Remove sensitive information\n"
+            "• **Backup Verification:** Ensure completeness"
+        ),
+        inline=True
+    )
+        
+    embed.add_field(
+        name="⚡ Quick Actions",
+        value=(
+            "• **Current Config Export:** Download current settings\n"
+            "• **30-Day Data Export:** Recent audit logs\n"
+            "• **Template Creation:** Save as reusable template\n"
+            "• **Emergency Backup:** Full system backup\n"
+            "• **Migration Package:** Complete transfer bundle"
+        ),
+        inline=False
+    )
+        
+    embed.set_footer(text="All exports include metadata for easy restoration")
+    
+    return embed
+
+# Setup modal error for an unresolvable channel
+_CHANNEL_NOT_FOUND_EMBED = discord.Embed.from_dict({
+    "title": "❌ Channel Not Found",
+    "description": "**Could not locate the specified channel.**\n\nPlease check the channel name or ID and try again.",
+    "color": discord.Color.red().value,
+    "fields": [
+        {
+            "name": "💡 Valid formats:",
+            "value": (
+                "• **Channel mention:** #audit-logs\n"
+                "• **Channel name:** audit-logs\n"
+                "• **Channel ID:** 123456789012345678"
+            ),
+            "inline": False,
+        },
+        {
+            "name": "🔍 Tips:",
+            "value": (
+                "• Ensure the channel exists in this server\n"
+                "• Check spelling and capitalization\n"
+                "• Make sure I can see the channel"
+            ),
+            "inline": False,
+        },
+    ],
+})
+
+# Setup welcome message; copied per send to add the footer and timestamp
+_WELCOME_EMBED_TEMPLATE = discord.Embed.from_dict({
+    "title": "🔍 Advanced Audit Logging System Activated",
+    "description": "**Welcome to your intelligent audit monitoring center!**\n\nThis channel will receive comprehensive, AI-enhanced audit logs for your server.",
+    "color": discord.Color.blue().value,
+    "fields": [
+        {
+            "name": "🎯 What you'll see here:",
+            "value": (
+                "• **Member Activity** - Joins, leaves, role changes with context\n"
+                "• **Moderation Actions** - Bans, kicks, mutes, disconnects with moderator detection\n"
+                "• **Voice Tracking** - Channel activity with session analytics\n"
+                "• **Message Events** - Edits, deletions with content preservation\n"
+                "• **Server Changes** - Channel and role modifications\n"
+                "• **Avatar Updates** - Member avatar changes with preview\n"
+                "• **Security Alerts** - Potential threats and violations"
+            ),
+            "inline": False,
+        },
+        {
+            "name": "✨ Advanced Features:",
+            "value": (
+                "🧠 **AI-Powered Detection** - Smart pattern recognition\n"
+                "🕵️ **Advanced Moderator Detection** - Identifies who performed actions\n"
+                "🔌 **Disconnect Tracking** - See who disconnected members from voice\n"
+                "⏱️ **Real-time Session Tracking** - Voice call duration monitoring\n"
+                "💾 **Content Preservation** - Saves deleted messages securely\n"
+                "🖼️ **Avatar History** - Visual tracking of profile changes\n"
+                "📊 **Intelligent Analytics** - Trend analysis and insights\n"
+                "🔍 **Smart Filtering** - Reduces noise, highlights important events\n"
+                "🛡️ **Security Monitoring** - Automated threat detection"
+            ),
+            "inline": False,
+        },
+        {
+            "name": "⚡ Performance Features:",
+            "value": (
+                "• **Real-time Processing** - Instant event detection\n"
+                "• **Smart Batching** - Efficient bulk operations\n"
+                "• **Automatic Optimization** - Self-tuning performance\n"
+                "• **Intelligent Caching** - Reduced server load"
+            ),
+            "inline": True,
+        },
+        {
+            "name": "🔧 Management:",
+            "value": (
+                "• **Easy Configuration** - `/auditconfig` command\n"
+                "• **Granular Control** - Toggle individual features\n"
+                "• **Custom Presets** - Quick setup options\n"
+                "• **Advanced Analytics** - Detailed reporting"
+            ),
+            "inline": True,
+        },
+    ],
+})
+
+# Setup success field templates; only the values are filled in per send
+_SETUP_SUCCESS_DESCRIPTION = "🎉 **Congratulations!** Your advanced audit logging system is now active in {channel}"
+_SETUP_CONFIG_TEMPLATE = (
+    "📍 **Channel:** {channel}\n"
+    "🗓️ **Retention:** {days} days\n"
+    "🤖 **Smart Defaults:** Applied based on server size\n"
+    "🔧 **Advanced Features:** Enabled"
+)
+_SETUP_SIZE_TEMPLATE = (
+    "**Member Count:** {members:,}\n"
+    "**Configuration:** {size}-server optimized\n"
+    "**Performance:** Balanced for your needs\n"
+    "**Features:** Intelligently selected"
+)
+
+# Access denied reply for the slash commands; the role list is fixed by config
+_ACCESS_DENIED_EMBED = discord.Embed.from_dict({
+    "title": "🔒 Access Denied",
+    "description": "**You don't have permission to use the advanced audit system.**",
+    "color": discord.Color.red().value,
+    "fields": [
+        {
+            "name": "🎭 Required Roles",
+            "value": "\n".join(f"• `{role}`" for role in ALLOWED_MANAGEMENT_ROLES),
+            "inline": False,
+        },
+        {
+            "name": "💡 Need Access?",
+            "value": "Contact a server administrator to get the required permissions.",
+            "inline": False,
+        },
+    ],
+    "footer": {"text": "Advanced audit system - Permission required"},
+})
+
+# Built once at import; never mutated, so sent as-is
+_HELP_EMBED = discord.Embed.from_dict(_HELP_PAYLOAD)
+_ADVANCED_CONFIG_EMBED = _build_advanced_config_embed()
+_EVENT_FILTERS_EMBED = _build_event_filters_embed()
+_CUSTOM_REPORTS_EMBED = _build_custom_reports_embed()
+_IMPORT_EXPORT_EMBED = _build_import_export_embed()
 
 # ========================= ADVANCED UI COMPONENTS =========================
 
+# Main panel button specs: (emoji, label, action, style, row)
+_ENABLED_BUTTONS = (
+    # Row 0: Primary actions
+    ("🔧", "Quick Setup", "reconfigure", discord.ButtonStyle.primary, 0),
+    ("⚙️", "Features", "features", discord.ButtonStyle.primary, 0),
+    ("📊", "Analytics", "analytics", discord.ButtonStyle.secondary, 0),
+    ("🧪", "Test", "test", discord.ButtonStyle.secondary, 0),
+    # Row 1: Secondary actions
+    ("🔍", "Search Logs", "search", discord.ButtonStyle.secondary, 1),
+    ("📥", "Export", "export", discord.ButtonStyle.secondary, 1),
+    ("⚡", "Performance", "performance", discord.ButtonStyle.secondary, 1),
+    ("🔴", "Disable", "disable", discord.ButtonStyle.danger, 1),
+)
+_DISABLED_BUTTONS = (
+    ("🚀", "Setup Now", "setup", discord.ButtonStyle.success, 0),
+    ("📊", "Status", "status", discord.ButtonStyle.secondary, 0),
+    ("🆘", "Help", "help", discord.ButtonStyle.secondary, 0),
+)
+
 class AuditConfigMainView(discord.ui.View):
     """Main control panel for audit configuration with advanced features."""
     
@@ -27,23 +1028,9 @@ class AuditConfigMainView(discord.ui.View):
         super().__init__(timeout=300)
         self.current_settings = current_settings
         
-        # Row 0: Primary actions
-        if current_settings['enabled']:
-            self.add_item(QuickActionButton("🔧", "Quick Setup", "reconfigure", discord.ButtonStyle.primary))
-            self.add_item(QuickActionButton("⚙️", "Features", "features", discord.ButtonStyle.primary))
-            self.add_item(QuickActionButton("📊", "Analytics", "analytics", discord.ButtonStyle.secondary))
-            self.add_item(QuickActionButton("🧪", "Test", "test", discord.ButtonStyle.secondary))
-        else:
-            self.add_item(QuickActionButton("🚀", "Setup Now", "setup", discord.ButtonStyle.success))
-            self.add_item(QuickActionButton("📊", "Status", "status", discord.ButtonStyle.secondary))
-            self.add_item(QuickActionButton("🆘", "Help", "help", discord.ButtonStyle.secondary))
-        
-        # Row 1: Secondary actions
-        if current_settings['enabled']:
-            self.add_item(QuickActionButton("🔍", "Search Logs", "search", discord.ButtonStyle.secondary, row=1))
-            self.add_item(QuickActionButton("📥", "Export", "export", discord.ButtonStyle.secondary, row=1))
-            self.add_item(QuickActionButton("⚡", "Performance", "performance", discord.ButtonStyle.secondary, row=1))
-            self.add_item(QuickActionButton("🔴", "Disable", "disable", discord.ButtonStyle.danger, row=1))
+        buttons = _ENABLED_BUTTONS if current_settings['enabled'] else _DISABLED_BUTTONS
+        for emoji, label, action, style, row in buttons:
+            self.add_item(QuickActionButton(emoji, label, action, style, row=row))
         
         # Row 2: Advanced dropdown
         self.add_item(AuditConfigAdvancedDropdown(current_settings))
@@ -71,10 +1058,10 @@ class QuickActionButton(discord.ui.Button):
             await self.show_analytics_dashboard(interaction)
             
         elif self.action == "status":
-            await self.show_detailed_status(interaction)
+            await self.show_detailed_status(interaction, current_settings)
             
         elif self.action == "test":
-            await self.run_comprehensive_test(interaction)
+            await self.run_comprehensive_test(interaction, current_settings)
             
         elif self.action == "search":
             modal = LogSearchModal()
@@ -84,86 +1071,32 @@ class QuickActionButton(discord.ui.Button):
             await self.export_audit_data(interaction)
             
         elif self.action == "performance":
-            await self.show_performance_metrics(interaction)
+            await self.show_performance_metrics(interaction, current_settings)
             
         elif self.action == "disable":
             view = DisableConfirmationView()
-            embed = discord.Embed(
-                title="⚠️ Disable Audit Logging",
-                description="**Are you sure you want to disable audit logging?**\n\nThis will stop all event monitoring and logging.",
-                color=discord.Color.orange()
-            )
-            embed.add_field(
-                name="🔄 What happens when disabled:",
-                value="• No new events will be logged\n• Existing logs will be kept\n• System can be re-enabled anytime\n• All settings will be preserved",
-                inline=False
-            )
-            await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
+            await interaction.response.send_message(embed=_DISABLE_PROMPT_EMBED, view=view, ephemeral=True)
             
         elif self.action == "help":
             await self.show_comprehensive_help(interaction)
     
     async def create_features_embed(self, settings: dict, guild: discord.Guild) -> discord.Embed:
         """Create a dynamic features overview embed."""
-        embed = discord.Embed(
-            title="⚙️ Audit Logging Features",
-            description="**Advanced event monitoring and logging system**\n\nClick the buttons below to toggle features:",
-            color=discord.Color.blue()
-        )
-        
-        # Feature categories with emoji indicators
-        member_features = []
-        if settings.get('log_members', True): member_features.append("✅ Joins/Leaves")
-        else: member_features.append("❌ Joins/Leaves")
-        
-        if settings.get('log_roles', True): member_features.append("✅ Role Changes")
-        else: member_features.append("❌ Role Changes")
-        
-        if settings.get('log_avatars', True): member_features.append("✅ Avatar Changes")
-        else: member_features.append("❌ Avatar Changes")
-        
-        moderation_features = []
-        if settings.get('log_moderation', True): moderation_features.append("✅ Bans/Kicks/Timeouts")
-        else: moderation_features.append("❌ Bans/Kicks/Timeouts")
-        
-        if settings.get('log_voice', True): moderation_features.append("✅ Voice Disconnects")
-        else: moderation_features.append("❌ Voice Disconnects")
-        
-        communication_features = []
-        if settings.get('log_messages', True): communication_features.append("✅ Message Events")
-        else: communication_features.append("❌ Message Events")
-        
-        if settings.get('log_voice', True): communication_features.append("✅ Voice Activity")
-        else: communication_features.append("❌ Voice Activity")
-        
-        if settings.get('log_server', True): communication_features.append("✅ Channel Events")
-        else: communication_features.append("❌ Channel Events")
-        
-        if settings.get('log_stage', True): communication_features.append("✅ Stage Events")
-        else: communication_features.append("❌ Stage Events")
-        
-        embed.add_field(
-            name="👥 Member Tracking",
-            value="\n".join(member_features),
-            inline=True
-        )
+        embed = _FEATURES_EMBED_TEMPLATE.copy()
         
-        embed.add_field(
-            name="🔨 Moderation",
-            value="\n".join(moderation_features),
-            inline=True
-        )
+        # Each flag is read once; log_voice feeds two rows
+        mask = feature_mask(settings)
         
-        embed.add_field(
-            name="💬 Communication",
-            value="\n".join(communication_features),
-            inline=True
-        )
+        # Feature categories with emoji indicators
+        for field_name, features in _FEATURE_FIELDS:
+            embed.add_field(
+                name=field_name,
+                value="\n".join(f"{'✅' if mask & _FEATURE_BITS[key] else '❌'} {label}" for label, key in features),
+                inline=True
+            )
         
         # Quick stats
-        enabled_count = sum(1 for key in ['log_members', 'log_roles', 'log_avatars', 'log_moderation', 
-                                          'log_messages', 'log_voice', 'log_server', 'log_stage'] 
-                           if settings.get(key, True))
+        enabled_count = mask.bit_count()
         
         embed.add_field(
             name="📈 Configuration Status",
@@ -171,68 +1104,73 @@ class QuickActionButton(discord.ui.Button):
             inline=False
         )
         
-        embed.set_footer(text="Changes are saved automatically • Use buttons below to toggle features")
         return embed
     
     async def show_analytics_dashboard(self, interaction: discord.Interaction):
         """Show comprehensive analytics dashboard."""
         try:
-            from config import DB_PATH
-            import aiosqlite
+            guild_id = interaction.guild.id
+            # Get comprehensive statistics
+            stats = {}
             
-            async with aiosqlite.connect(DB_PATH) as db:
-                # Get comprehensive statistics
-                stats = {}
-                
-                # Total events
-                async with db.execute("SELECT COUNT(*) FROM audit_logs WHERE guild_id = ?", (interaction.guild.id,)) as cursor:
-                    stats['total_events'] = (await cursor.fetchone())[0]
-                
+            # Recent activity cutoffs (last 24h, 7d, 30d)
+            now = datetime.utcnow()
+            cutoffs = [(now - timedelta(hours=hours)).isoformat() for hours in (24, 168, 720)]
+            
+            async def voice_stats():
+                # voice_sessions may not exist on older databases
+                try:
+                    return await fetch_all("""
+                        SELECT COUNT(*), AVG(duration_seconds), MAX(duration_seconds) 
+                        FROM voice_sessions 
+                        WHERE guild_id = ? AND is_active = FALSE AND duration_seconds > 0
+                    """, (guild_id,))
+                except Exception:
+                    return []
+            
+            # Independent queries run concurrently on pooled connections
+            period_rows, stats['top_events'], voice_rows, stats['top_users'] = await asyncio.gather(
+                # Total events plus the three period counts in one scan
+                fetch_all("""
+                    SELECT COUNT(*),
+                           SUM(CASE WHEN timestamp > ? THEN 1 ELSE 0 END),
+                           SUM(CASE WHEN timestamp > ? THEN 1 ELSE 0 END),
+                           SUM(CASE WHEN timestamp > ? THEN 1 ELSE 0 END)
+                    FROM audit_logs 
+                    WHERE guild_id = ?
+                """, (*cutoffs, guild_id)),
                 # Events by type
-                async with db.execute("""
+                fetch_all("""
                     SELECT event_type, COUNT(*) FROM audit_logs 
                     WHERE guild_id = ? 
                     GROUP BY event_type 
                     ORDER BY COUNT(*) DESC 
                     LIMIT 5
-                """, (interaction.guild.id,)) as cursor:
-                    stats['top_events'] = await cursor.fetchall()
-                
-                # Recent activity (last 24h, 7d, 30d)
-                now = datetime.utcnow()
-                
-                for period, hours in [("24h", 24), ("7d", 168), ("30d", 720)]:
-                    cutoff = (now - timedelta(hours=hours)).isoformat()
-                    async with db.execute("""
-                        SELECT COUNT(*) FROM audit_logs 
-                        WHERE guild_id = ? AND timestamp > ?
-                    """, (interaction.guild.id, cutoff)) as cursor:
-                        stats[f'events_{period}'] = (await cursor.fetchone())[0]
-                
-                # Voice session statistics
-                try:
-                    async with db.execute("""
-                        SELECT COUNT(*), AVG(duration_seconds), MAX(duration_seconds) 
-                        FROM voice_sessions 
-                        WHERE guild_id = ? AND is_active = FALSE AND duration_seconds > 0
-                    """, (interaction.guild.id,)) as cursor:
-                        voice_data = await cursor.fetchone()
-                        if voice_data and voice_data[0]:
-                            stats['voice_sessions'] = voice_data[0]
-                            stats['avg_voice_duration'] = int(voice_data[1]) if voice_data[1] else 0
-                            stats['max_voice_duration'] = voice_data[2] if voice_data[2] else 0
-                except:
-                    pass
-                
+                """, (guild_id,)),
+                voice_stats(),
                 # Top users by activity
-                async with db.execute("""
-                    SELECT user_name, COUNT(*) FROM audit_logs 
-                    WHERE guild_id = ? AND user_name IS NOT NULL
-                    GROUP BY user_id 
-                    ORDER BY COUNT(*) DESC 
+                fetch_all("""
+                    SELECT user_name, c FROM (
+                        SELECT user_id, user_name, COUNT(*) AS c FROM audit_logs 
+                        WHERE guild_id = ? AND user_name IS NOT NULL
+                        GROUP BY user_id
+                    )
+                    ORDER BY c DESC 
                     LIMIT 5
-                """, (interaction.guild.id,)) as cursor:
-                    stats['top_users'] = await cursor.fetchall()
+                """, (guild_id,)),
+            )
+            
+            row = period_rows[0]
+            stats['total_events'] = row[0]
+            stats['events_24h'] = row[1] or 0
+            stats['events_7d'] = row[2] or 0
+            stats['events_30d'] = row[3] or 0
+            
+            voice_data = voice_rows[0] if voice_rows else None
+            if voice_data and voice_data[0]:
+                stats['voice_sessions'] = voice_data[0]
+                stats['avg_voice_duration'] = int(voice_data[1]) if voice_data[1] else 0
+                stats['max_voice_duration'] = voice_data[2] if voice_data[2] else 0
             
             embed = discord.Embed(
                 title="📊 Audit Analytics Dashboard",
@@ -254,7 +1192,6 @@ class QuickActionButton(discord.ui.Button):
             
             # Voice statistics
             if stats.get('voice_sessions'):
-                from audit_logging import format_duration
                 embed.add_field(
                     name="🎙️ Voice Activity",
                     value=(
@@ -269,7 +1206,7 @@ class QuickActionButton(discord.ui.Button):
             if stats['top_events']:
                 event_list = []
                 for event_type, count in stats['top_events']:
-                    event_name = event_type.replace('_', ' ').title()
+                    event_name = _pretty_event(event_type)
                     event_list.append(f"**{event_name}:** {count:,}")
                 
                 embed.add_field(
@@ -318,7 +1255,7 @@ class QuickActionButton(discord.ui.Button):
                 )
             
             embed.set_footer(text="Analytics updated in real-time")
-            embed.timestamp = discord.utils.utcnow()
+            embed.timestamp = now.replace(tzinfo=timezone.utc)
             
         except Exception as e:
             embed = discord.Embed(
@@ -329,9 +1266,8 @@ class QuickActionButton(discord.ui.Button):
         
         await interaction.response.send_message(embed=embed, ephemeral=True)
     
-    async def show_detailed_status(self, interaction: discord.Interaction):
+    async def show_detailed_status(self, interaction: discord.Interaction, settings: dict):
         """Show comprehensive system status."""
-        settings = await get_audit_settings(interaction.guild.id)
         
         embed = discord.Embed(
             title="📊 System Status Dashboard",
@@ -362,19 +1298,9 @@ class QuickActionButton(discord.ui.Button):
         )
         
         # Feature matrix
-        features = {
-            "👥 Member Events": settings.get('log_members', True),
-            "🎭 Role Changes": settings.get('log_roles', True),
-            "🔊 Voice Activity": settings.get('log_voice', True),
-            "💬 Messages": settings.get('log_messages', True),
-            "🔨 Moderation": settings.get('log_moderation', True),
-            "📋 Server Events": settings.get('log_server', True),
-            "🎙️ Stage Events": settings.get('log_stage', True),
-            "🖼️ Avatar Changes": settings.get('log_avatars', True),
-        }
-        
-        enabled_features = [name for name, enabled in features.items() if enabled]
-        disabled_features = [name for name, enabled in features.items() if not enabled]
+        enabled_features, disabled_features = [], []
+        for name, key in _FEATURE_LABELS:
+            (enabled_features if settings.get(key, True) else disabled_features).append(name)
         
         if enabled_features:
             embed.add_field(
@@ -432,9 +1358,8 @@ class QuickActionButton(discord.ui.Button):
         
         await interaction.response.send_message(embed=embed, ephemeral=True)
     
-    async def run_comprehensive_test(self, interaction: discord.Interaction):
+    async def run_comprehensive_test(self, interaction: discord.Interaction, settings: dict):
         """Run comprehensive system tests."""
-        settings = await get_audit_settings(interaction.guild.id)
         
         if not settings['enabled'] or not settings['log_channel_id']:
             embed = discord.Embed(
@@ -460,8 +1385,8 @@ class QuickActionButton(discord.ui.Button):
         
         # Test 1: Channel permissions
         try:
-            permissions = channel.permissions_for(interaction.guild.me)
-            if permissions.send_messages and permissions.embed_links:
+            permissions = channel.permissions_for(interaction.guild.me).value
+            if permissions & _NEEDED_LOG_PERMISSIONS == _NEEDED_LOG_PERMISSIONS:
                 test_results.append("✅ Channel Permissions")
             else:
                 test_results.append("❌ Channel Permissions")
@@ -470,10 +1395,7 @@ class QuickActionButton(discord.ui.Button):
         
         # Test 2: Database connectivity
         try:
-            from config import DB_PATH
-            import aiosqlite
-            async with aiosqlite.connect(DB_PATH) as db:
-                await db.execute("SELECT 1")
+            await fetch_all("SELECT 1")
             test_results.append("✅ Database Connection")
         except:
             test_results.append("❌ Database Connection")
@@ -550,22 +1472,16 @@ class QuickActionButton(discord.ui.Button):
     async def export_audit_data(self, interaction: discord.Interaction):
         """Export audit data in various formats."""
         try:
-            from config import DB_PATH
-            import aiosqlite
-            import json
-            
-            async with aiosqlite.connect(DB_PATH) as db:
-                # Get recent audit logs
-                async with db.execute("""
-                    SELECT event_type, user_name, target_name, 
-                           moderator_name, timestamp, channel_name,
-                           reason, before_value, after_value
-                    FROM audit_logs 
-                    WHERE guild_id = ?
-                    ORDER BY timestamp DESC 
-                    LIMIT 100
-                """, (interaction.guild.id,)) as cursor:
-                    logs = await cursor.fetchall()
+            # Get recent audit logs
+            logs = await fetch_all("""
+                SELECT event_type, user_name, target_name, 
+                       moderator_name, timestamp, channel_name,
+                       reason, before_value, after_value
+                FROM audit_logs 
+                WHERE guild_id = ?
+                ORDER BY timestamp DESC 
+                LIMIT 100
+            """, (interaction.guild.id,))
             
             if not logs:
                 embed = discord.Embed(
@@ -576,45 +1492,38 @@ class QuickActionButton(discord.ui.Button):
                 await interaction.response.send_message(embed=embed, ephemeral=True)
                 return
             
-            # Format data for export
-            export_data = {
+            now = datetime.utcnow()
+            
+            # Serialize straight from the rows into the attached JSON file
+            export_json = json.dumps({
                 "server": interaction.guild.name,
-                "export_date": datetime.utcnow().isoformat(),
+                "export_date": now.isoformat(),
                 "total_records": len(logs),
-                "logs": []
-            }
-            
-            for log in logs:
-                export_data["logs"].append({
-                    "type": log[0],
-                    "user": log[1],
-                    "target": log[2],
-                    "moderator": log[3],
-                    "timestamp": log[4],
-                    "channel": log[5],
-                    "reason": log[6],
-                    "before": log[7],
-                    "after": log[8]
-                })
+                "logs": [dict(zip(_EXPORT_COLUMNS, log)) for log in logs]
+            }, ensure_ascii=False).encode()
+            export_file = discord.File(io.BytesIO(export_json), filename=f"audit_export_{interaction.guild.id}.json")
             
             # Create formatted text version
-            text_export = f"""
+            parts = [f"""
 # Audit Log Export - {interaction.guild.name}
-# Generated: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}
+# Generated: {now.strftime('%Y-%m-%d %H:%M:%S UTC')}
 # Records: {len(logs)}
 
-"""
+"""]
             
             for i, log in enumerate(logs[:20], 1):  # Limit to prevent message being too long
-                text_export += f"{i}. [{log[4]}] {log[0]}: "
-                if log[1]: text_export += f"{log[1]}"
-                if log[2] and log[2] != log[1]: text_export += f" → {log[2]}"
-                if log[3]: text_export += f" (by {log[3]})"
-                if log[6]: text_export += f" - {log[6]}"
-                text_export += "\n"
+                parts.append(f"{i}. [{log[4]}] {log[0]}: ")
+                if log[1]: parts.append(f"{log[1]}")
+                if log[2] and log[2] != log[1]: parts.append(f" → {log[2]}")
+                if log[3]: parts.append(f" (by {log[3]})")
+                if log[6]: parts.append(f" - {log[6]}")
+                parts.append("\n")
             
             if len(logs) > 20:
-                text_export += f"\n... and {len(logs) - 20} more records"
+                parts.append(f"\n... and {len(logs) - 20} more records")
+            
+            text_export = "".join(parts)
+            text_length = len(text_export)
             
             embed = discord.Embed(
                 title="📥 Audit Data Export",
@@ -627,21 +1536,21 @@ class QuickActionButton(discord.ui.Button):
                 value=(
                     f"**Records:** {len(logs)}\n"
                     f"**Date Range:** Last 100 events\n"
-                    f"**Format:** Structured text\n"
-                    f"**Size:** ~{len(text_export)} characters"
+                    f"**Format:** Structured text + JSON file\n"
+                    f"**Size:** ~{text_length} characters"
                 ),
                 inline=False
             )
             
             embed.add_field(
                 name="📋 Sample Data",
-                value=f"```{text_export[:500]}{'...' if len(text_export) > 500 else ''}```",
+                value=f"```{text_export[:500]}{'...' if text_length > 500 else ''}```",
                 inline=False
             )
             
             embed.set_footer(text=f"Exported by {interaction.user.display_name}")
             
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.response.send_message(embed=embed, file=export_file, ephemeral=True)
             
         except Exception as e:
             embed = discord.Embed(
@@ -651,7 +1560,7 @@ class QuickActionButton(discord.ui.Button):
             )
             await interaction.response.send_message(embed=embed, ephemeral=True)
     
-    async def show_performance_metrics(self, interaction: discord.Interaction):
+    async def show_performance_metrics(self, interaction: discord.Interaction, settings: dict):
         """Show detailed performance metrics."""
         embed = discord.Embed(
             title="⚡ Performance Metrics",
@@ -660,12 +1569,9 @@ class QuickActionButton(discord.ui.Button):
         )
         
         try:
-            import psutil
-            import os
-            
             # System metrics
             memory_usage = psutil.virtual_memory().percent
-            cpu_usage = psutil.cpu_percent(interval=1)
+            cpu_usage = cpu_percent()
             
             embed.add_field(
                 name="💻 System Resources",
@@ -684,19 +1590,13 @@ class QuickActionButton(discord.ui.Button):
             )
         
         # Database performance
+        db_size = 0  # Stays 0 if the size can't be read
         try:
-            from config import DB_PATH
-            import aiosqlite
-            import os
-            
-            db_size = os.path.getsize(DB_PATH) / (1024 * 1024)  # MB
+            db_size = db_size_mb()
             
-            async with aiosqlite.connect(DB_PATH) as db:
-                start_time = datetime.utcnow()
-                async with db.execute("SELECT COUNT(*) FROM audit_logs WHERE guild_id = ?", (interaction.guild.id,)) as cursor:
-                    record_count = (await cursor.fetchone())[0]
-                end_time = datetime.utcnow()
-                query_time = (end_time - start_time).total_seconds() * 1000
+            t0 = time.perf_counter_ns()
+            record_count = (await fetch_all("SELECT COUNT(*) FROM audit_logs WHERE guild_id = ?", (interaction.guild.id,)))[0][0]
+            query_time = (time.perf_counter_ns() - t0) / 1e6
             
             embed.add_field(
                 name="🗄️ Database Performance",
@@ -728,10 +1628,7 @@ class QuickActionButton(discord.ui.Button):
         )
         
         # Feature performance
-        settings = await get_audit_settings(interaction.guild.id)
-        enabled_features = sum(1 for key in ['log_members', 'log_roles', 'log_voice', 'log_messages', 
-                                            'log_moderation', 'log_server', 'log_stage', 'log_avatars'] 
-                              if settings.get(key, True))
+        enabled_features = feature_mask(settings).bit_count()
         
         embed.add_field(
             name="🔧 Configuration Impact",
@@ -756,23 +1653,14 @@ class QuickActionButton(discord.ui.Button):
         )
         
         # Recommendations
-        recommendations = []
-        if enabled_features > 6:
-            recommendations.append("• Consider disabling unused features")
-        
-        try:
-            if db_size > 100:
-                recommendations.append("• Database cleanup recommended")
-        except:
-            pass
-        
-        if not recommendations:
-            recommendations.append("• System is optimally configured")
-            recommendations.append("• No performance concerns detected")
+        recommendations = "\n".join(filter(None, (
+            "• Consider disabling unused features" if enabled_features > 6 else None,
+            "• Database cleanup recommended" if db_size > 100 else None,
+        ))) or "• System is optimally configured\n• No performance concerns detected"
         
         embed.add_field(
             name="💡 Performance Recommendations",
-            value="\n".join(recommendations),
+            value=recommendations,
             inline=False
         )
         
@@ -783,90 +1671,7 @@ class QuickActionButton(discord.ui.Button):
     
     async def show_comprehensive_help(self, interaction: discord.Interaction):
         """Show comprehensive help and documentation."""
-        embed = discord.Embed(
-            title="🆘 Comprehensive Audit Logging Guide",
-            description="**Everything you need to know about the audit logging system**",
-            color=discord.Color.blue()
-        )
-        
-        embed.add_field(
-            name="🚀 Quick Start",
-            value=(
-                "1. **Setup:** Use 🚀 Setup Now to configure a channel\n"
-                "2. **Features:** Toggle what events to monitor\n"
-                "3. **Test:** Verify everything works correctly\n"
-                "4. **Monitor:** Check analytics and performance"
-            ),
-            inline=False
-        )
-        
-        embed.add_field(
-            name="🔍 Advanced Features",
-            value=(
-                "**🕵️ Smart Detection:** Automatically identifies moderators\n"
-                "**⏱️ Voice Tracking:** Monitors session durations\n"
-                "**💾 Content Preservation:** Saves deleted messages\n"
-                "**🔌 Disconnect Detection:** Tracks voice disconnects\n"
-                "**🖼️ Avatar Tracking:** Monitors avatar changes\n"
-                "**📊 Analytics:** Comprehensive usage statistics\n"
-                "**🔍 Search:** Find specific events quickly\n"
-                "**📥 Export:** Data export in multiple formats"
-            ),
-            inline=False
-        )
-        
-        embed.add_field(
-            name="⚙️ Configuration Tips",
-            value=(
-                "• **Channel Setup:** Use a dedicated audit channel\n"
-                "• **Permissions:** Ensure bot can view audit logs\n"
-                "• **Retention:** 30-90 days recommended\n"
-                "• **Features:** Enable only what you need\n"
-                "• **Testing:** Regular system health checks"
-            ),
-            inline=False
-        )
-        
-        embed.add_field(
-            name="🎯 Event Types",
-            value=(
-                "**👥 Members:** Joins, leaves, role changes, nicknames, avatars\n"
-                "**🔨 Moderation:** Bans, kicks, mutes, disconnects with reasons\n"
-                "**🔊 Voice:** Channel activity, session tracking, disconnects\n"
-                "**💬 Messages:** Edits, deletions with full content\n"
-                "**📋 Server:** Channel and role modifications\n"
-                "**🎙️ Stage:** Speaker/listener changes with context"
-            ),
-            inline=False
-        )
-        
-        embed.add_field(
-            name="📊 Analytics Features",
-            value=(
-                "• **Activity Trends:** Track server engagement\n"
-                "• **User Statistics:** Most active members\n"
-                "• **Event Breakdown:** Popular action types\n"
-                "• **Performance Metrics:** System health\n"
-                "• **Custom Reports:** Export filtered data"
-            ),
-            inline=False
-        )
-        
-        embed.add_field(
-            name="🔧 Troubleshooting",
-            value=(
-                "**No logs?** Check channel permissions\n"
-                "**Missing moderator?** Enable 'View Audit Log' permission\n"
-                "**High usage?** Disable unused features\n"
-                "**Performance issues?** Check system metrics\n"
-                "**Data concerns?** Adjust retention period"
-            ),
-            inline=False
-        )
-        
-        embed.set_footer(text="Need more help? Use the various dashboard features to explore!")
-        
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await interaction.response.send_message(embed=_HELP_EMBED, ephemeral=True)
 
 # ========================= CONTINUATION OF UI COMPONENTS =========================
 
@@ -947,187 +1752,15 @@ class AuditConfigAdvancedDropdown(discord.ui.Select):
     
     async def show_advanced_config(self, interaction: discord.Interaction):
         """Show advanced configuration options."""
-        embed = discord.Embed(
-            title="🎛️ Advanced Configuration",
-            description="**Fine-tune your audit logging system**\n\nAdvanced settings for power users:",
-            color=discord.Color.blue()
-        )
-        
-        embed.add_field(
-            name="🔍 Detection Settings",
-            value=(
-                "• **Moderator Detection:** Advanced AI-powered detection\n"
-                "• **Disconnect Detection:** Tracks voice channel disconnects\n"
-                "• **Bulk Action Detection:** Identifies mass operations\n"
-                "• **Spam Filter:** Reduces noise from repeated actions\n"
-                "• **Context Analysis:** Enhanced event correlation"
-            ),
-            inline=False
-        )
-        
-        embed.add_field(
-            name="⚡ Performance Tuning",
-            value=(
-                "• **Batch Processing:** Groups related events\n"
-                "• **Smart Caching:** Reduces database queries\n"
-                "• **Rate Limiting:** Prevents system overload\n"
-                "• **Async Processing:** Non-blocking operations"
-            ),
-            inline=False
-        )
-        
-        embed.add_field(
-            name="🎯 Accuracy Enhancements",
-            value=(
-                "• **Double Verification:** Cross-checks audit logs\n"
-                "• **Timestamp Precision:** Microsecond accuracy\n"
-                "• **Event Deduplication:** Removes duplicate entries\n"
-                "• **Error Correction:** Auto-fixes common issues"
-            ),
-            inline=False
-        )
-        
-        embed.add_field(
-            name="🛡️ Security Features",
-            value=(
-                "• **Tamper Detection:** Monitors log integrity\n"
-                "• **Access Logging:** Tracks who views logs\n"
-                "• **Encryption:** Secure data storage\n"
-                "• **Audit Trail:** Comprehensive change tracking"
-            ),
-            inline=False
-        )
-        
-        embed.set_footer(text="These advanced features are automatically optimized for your server")
-        
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await interaction.response.send_message(embed=_ADVANCED_CONFIG_EMBED, ephemeral=True)
     
     async def show_event_filters(self, interaction: discord.Interaction):
         """Show event filtering configuration."""
-        embed = discord.Embed(
-            title="🔍 Event Filters",
-            description="**Configure intelligent event filtering**\n\nReduce noise and focus on important events:",
-            color=discord.Color.blue()
-        )
-        
-        embed.add_field(
-            name="🎯 Smart Filters",
-            value=(
-                "• **Bot Activity Filter:** Hide bot-generated events\n"
-                "• **Bulk Action Filter:** Consolidate mass operations\n"
-                "• **Spam Reduction:** Limit repeated similar events\n"
-                "• **Time-based Grouping:** Merge rapid-fire actions"
-            ),
-            inline=False
-        )
-        
-        embed.add_field(
-            name="👥 User Filters",
-            value=(
-                "• **Role-based Filtering:** Focus on specific roles\n"
-                "• **VIP Monitoring:** Enhanced tracking for important users\n"
-                "• **New Member Focus:** Extra attention to recent joins\n"
-                "• **Staff Action Tracking:** Detailed moderator monitoring"
-            ),
-            inline=False
-        )
-        
-        embed.add_field(
-            name="⏰ Time Filters",
-            value=(
-                "• **Peak Hours:** Increased sensitivity during busy times\n"
-                "• **Quiet Periods:** Reduced monitoring during low activity\n"
-                "• **Event Scheduling:** Custom monitoring windows\n"
-                "• **Historical Analysis:** Pattern-based filtering"
-            ),
-            inline=False
-        )
-        
-        embed.add_field(
-            name="📊 Current Filter Status",
-            value=(
-                "✅ **Smart Deduplication:** Active\n"
-                "✅ **Bot Filtering:** Active\n"
-                "✅ **Spam Reduction:** Active\n"
-                "✅ **Performance Optimization:** Active"
-            ),
-            inline=False
-        )
-        
-        embed.set_footer(text="Filters are intelligently applied to improve signal-to-noise ratio")
-        
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await interaction.response.send_message(embed=_EVENT_FILTERS_EMBED, ephemeral=True)
     
     async def show_custom_reports(self, interaction: discord.Interaction):
         """Show custom reporting options."""
-        embed = discord.Embed(
-            title="📊 Custom Reports",
-            description="**Generate detailed audit reports**\n\nCreate comprehensive analysis of your server activity:",
-            color=discord.Color.blue()
-        )
-        
-        embed.add_field(
-            name="📈 Available Reports",
-            value=(
-                "• **Activity Summary:** Daily/weekly/monthly overviews\n"
-                "• **User Behavior Analysis:** Individual user patterns\n"
-                "• **Moderation Report:** Staff action summary\n"
-                "• **Security Audit:** Potential security concerns\n"
-                "• **Growth Analysis:** Member join/leave trends\n"
-                "• **Voice Activity Report:** Call statistics\n"
-                "• **Avatar Change Report:** Visual history tracking"
-            ),
-            inline=False
-        )
-        
-        embed.add_field(
-            name="🎯 Report Features",
-            value=(
-                "• **Custom Date Ranges:** Specify exact periods\n"
-                "• **Multiple Formats:** Text, charts, CSV export\n"
-                "• **Automated Generation:** Scheduled reports\n"
-                "• **Filtered Data:** Focus on specific events\n"
-                "• **Comparative Analysis:** Compare time periods\n"
-                "• **Trend Identification:** Spot patterns"
-            ),
-            inline=False
-        )
-        
-        embed.add_field(
-            name="⚡ Quick Reports",
-            value=(
-                "• **Last 24 Hours:** Recent activity snapshot\n"
-                "• **This Week:** Weekly activity summary\n"
-                "• **Top Users:** Most active members\n"
-                "• **Recent Joins:** New member overview\n"
-                "• **Moderation Actions:** Staff activity log\n"
-                "• **Voice Statistics:** Call duration analysis\n"
-                "• **Avatar Changes:** Recent profile updates"
-            ),
-            inline=False
-        )
-        
-        embed.add_field(
-            name="📋 Sample Report Data",
-            value=(
-                "```\n"
-                "📊 Weekly Activity Report\n"
-                "• Total Events: 1,247\n"
-                "• New Members: 23\n"
-                "• Messages Deleted: 156\n"
-                "• Role Changes: 89\n"
-                "• Voice Sessions: 445\n"
-                "• Avg Session: 24m\n"
-                "• Avatar Changes: 12\n"
-                "• Disconnects: 8\n"
-                "```"
-            ),
-            inline=False
-        )
-        
-        embed.set_footer(text="Reports can be generated on-demand or scheduled automatically")
-        
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await interaction.response.send_message(embed=_CUSTOM_REPORTS_EMBED, ephemeral=True)
     
     async def show_maintenance_options(self, interaction: discord.Interaction):
         """Show system maintenance options."""
@@ -1138,24 +1771,14 @@ class AuditConfigAdvancedDropdown(discord.ui.Select):
         )
         
         try:
-            from config import DB_PATH
-            import os
-            import aiosqlite
-            
             # Get database statistics
-            db_size = os.path.getsize(DB_PATH) / (1024 * 1024)  # MB
+            db_size = db_size_mb()
             
-            async with aiosqlite.connect(DB_PATH) as db:
-                async with db.execute("SELECT COUNT(*) FROM audit_logs WHERE guild_id = ?", (interaction.guild.id,)) as cursor:
-                    total_logs = (await cursor.fetchone())[0]
-                
-                # Check for old logs
-                from datetime import datetime, timedelta
-                settings = await get_audit_settings(interaction.guild.id)
-                cutoff = (datetime.utcnow() - timedelta(days=settings.get('retention_days', 30))).isoformat()
-                
-                async with db.execute("SELECT COUNT(*) FROM audit_logs WHERE guild_id = ? AND timestamp < ?", (interaction.guild.id, cutoff)) as cursor:
-                    old_logs = (await cursor.fetchone())[0]
+            # Old logs are those past the retention window; the counts borrow
+            # their own connection so concurrent presses share one query
+            async with db_connection() as db:
+                settings = await get_audit_settings(interaction.guild.id, db=db)
+            total_logs, old_logs = await get_log_counts(interaction.guild.id, settings.get('retention_days', 30))
             
             embed.add_field(
                 name="📊 Database Statistics",
@@ -1217,79 +1840,7 @@ class AuditConfigAdvancedDropdown(discord.ui.Select):
     
     async def show_import_export(self, interaction: discord.Interaction):
         """Show import/export configuration options."""
-        embed = discord.Embed(
-            title="⚙️ Import/Export Tools",
-            description="**Backup and restore your audit configuration**\n\nPowerful tools for configuration management:",
-            color=discord.Color.blue()
-        )
-        
-        embed.add_field(
-            name="📤 Export Options",
-            value=(
-                "• **Configuration Backup:** Full settings export\n"
-                "• **Audit Data Export:** Historical log data\n"
-                "• **Custom Reports:** Formatted analysis\n"
-                "• **Statistics Export:** Performance metrics\n"
-                "• **Schema Export:** Database structure\n"
-                "• **Filtered Exports:** Specific date ranges"
-            ),
-            inline=False
-        )
-        
-        embed.add_field(
-            name="📥 Import Options",
-            value=(
-                "• **Configuration Restore:** Apply saved settings\n"
-                "• **Bulk Configuration:** Setup multiple servers\n"
-                "• **Migration Tools:** Transfer between bots\n"
-                "• **Template Import:** Use predefined configs\n"
-                "• **Selective Import:** Choose specific settings\n"
-                "• **Merge Configurations:** Combine settings"
-            ),
-            inline=False
-        )
-        
-        embed.add_field(
-            name="📋 Export Formats",
-            value=(
-                "• **JSON:** Machine-readable configuration\n"
-                "• **CSV:** Spreadsheet-compatible data\n"
-                "• **TXT:** Human-readable reports\n"
-                "• **XML:** Structured data format\n"
-                "• **SQL:** Database dump format\n"
-                "• **YAML:** Configuration file format"
-            ),
-            inline=True
-        )
-        
-        embed.add_field(
-            name="🔒 Security Features",
-            value=(
-                "• **Encryption:** Secure sensitive data\n"
-                "• **Access Control:** Permission-based exports\n"
-                "• **Audit Trail:** Track import/export actions\n"
-                "• **Validation:** Verify data integrity\n"
-                "• **Sanitization:** Remove sensitive information\n"
-                "• **Backup Verification:** Ensure completeness"
-            ),
-            inline=True
-        )
-        
-        embed.add_field(
-            name="⚡ Quick Actions",
-            value=(
-                "• **Current Config Export:** Download current settings\n"
-                "• **30-Day Data Export:** Recent audit logs\n"
-                "• **Template Creation:** Save as reusable template\n"
-                "• **Emergency Backup:** Full system backup\n"
-                "• **Migration Package:** Complete transfer bundle"
-            ),
-            inline=False
-        )
-        
-        embed.set_footer(text="All exports include metadata for easy restoration")
-        
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await interaction.response.send_message(embed=_IMPORT_EXPORT_EMBED, ephemeral=True)
 
 class FeatureToggleView(discord.ui.View):
     """Advanced feature management with intelligent grouping."""
@@ -1298,15 +1849,10 @@ class FeatureToggleView(discord.ui.View):
         super().__init__(timeout=300)
         self.current_settings = current_settings
         
-        # Row 0: Core features
-        self.add_item(FeatureButton("👥", "Members", ["log_members", "log_avatars"], 0))
-        self.add_item(FeatureButton("🎭", "Roles", ["log_roles"], 0))
-        self.add_item(FeatureButton("🔊", "Voice", ["log_voice"], 0))
-        
-        # Row 1: Communication features
-        self.add_item(FeatureButton("💬", "Messages", ["log_messages"], 1))
-        self.add_item(FeatureButton("📋", "Server", ["log_server"], 1))
-        self.add_item(FeatureButton("🔨", "Moderation", ["log_moderation"], 1))
+        # Rows 0-1: Feature groups, colored by their current state
+        for emoji, label, keys, row in _FEATURE_LAYOUT:
+            enabled = any(current_settings.get(key, True) for key in keys)
+            self.add_item(FeatureButton(emoji, label, keys, row, enabled=enabled))
         
         # Row 2: Bulk actions
         self.add_item(BulkActionButton("✅", "Enable All", True, 2))
@@ -1316,21 +1862,21 @@ class FeatureToggleView(discord.ui.View):
 class FeatureButton(discord.ui.Button):
     """Individual feature toggle button."""
     
-    def __init__(self, emoji: str, label: str, settings: list, row: int):
+    def __init__(self, emoji: str, label: str, settings: tuple, row: int, enabled: bool = True):
         self.settings = settings
-        style = discord.ButtonStyle.success  # Will be updated based on current state
+        style = discord.ButtonStyle.success if enabled else discord.ButtonStyle.secondary
         super().__init__(emoji=emoji, label=label, style=style, row=row)
     
     async def callback(self, interaction: discord.Interaction):
-        current_settings = await get_audit_settings(interaction.guild.id)
-        
-        # Determine current state
-        any_enabled = any(current_settings.get(setting, True) for setting in self.settings)
-        new_state = not any_enabled
+        # Flip the flags in a single UPDATE ... RETURNING
+        new_state = await toggle_audit_settings(interaction.guild.id, self.settings)
         
-        # Update settings
-        settings_to_save = {setting: new_state for setting in self.settings}
-        await save_audit_settings(interaction.guild.id, **settings_to_save)
+        if new_state is None:
+            # No settings row yet: read defaults and create it
+            current_settings = await get_audit_settings(interaction.guild.id)
+            new_state = not any(current_settings.get(setting, True) for setting in self.settings)
+            settings_to_save = {setting: new_state for setting in self.settings}
+            await save_audit_settings(interaction.guild.id, **settings_to_save)
         
         # Create response
         status = "enabled" if new_state else "disabled"
@@ -1380,12 +1926,7 @@ class BulkActionButton(discord.ui.Button):
         super().__init__(emoji=emoji, label=label, style=style, row=row)
     
     async def callback(self, interaction: discord.Interaction):
-        all_settings = [
-            'log_members', 'log_roles', 'log_avatars', 'log_moderation', 
-            'log_voice', 'log_messages', 'log_server', 'log_stage'
-        ]
-        
-        settings_to_save = {setting: self.target_state for setting in all_settings}
+        settings_to_save = dict.fromkeys(_FEATURE_KEYS, self.target_state)
         await save_audit_settings(interaction.guild.id, **settings_to_save)
         
         status = "enabled" if self.target_state else "disabled"
@@ -1457,49 +1998,49 @@ class PresetButton(discord.ui.Button):
 class PresetSelectionView(discord.ui.View):
     """Preset selection dropdown."""
     
+    # Static options, built once at import
+    _OPTIONS = (
+        discord.SelectOption(
+            label="Basic Monitoring",
+            value="basic",
+            description="Member joins/leaves, bans, kicks",
+            emoji="🟢"
+        ),
+        discord.SelectOption(
+            label="Standard Configuration",
+            value="standard",
+            description="Most common events for typical servers",
+            emoji="🔵"
+        ),
+        discord.SelectOption(
+            label="Comprehensive Tracking",
+            value="comprehensive", 
+            description="Monitor all available events",
+            emoji="🟣"
+        ),
+        discord.SelectOption(
+            label="Moderation Focus",
+            value="moderation",
+            description="Staff actions and enforcement",
+            emoji="🔨"
+        ),
+        discord.SelectOption(
+            label="Community Focus",
+            value="community",
+            description="Member activity and engagement",
+            emoji="👥"
+        ),
+        discord.SelectOption(
+            label="Security Focus",
+            value="security",
+            description="Potential threats and violations",
+            emoji="🛡️"
+        )
+    )
+    
     def __init__(self):
         super().__init__(timeout=60)
-        
-        options = [
-            discord.SelectOption(
-                label="Basic Monitoring",
-                value="basic",
-                description="Member joins/leaves, bans, kicks",
-                emoji="🟢"
-            ),
-            discord.SelectOption(
-                label="Standard Configuration",
-                value="standard",
-                description="Most common events for typical servers",
-                emoji="🔵"
-            ),
-            discord.SelectOption(
-                label="Comprehensive Tracking",
-                value="comprehensive", 
-                description="Monitor all available events",
-                emoji="🟣"
-            ),
-            discord.SelectOption(
-                label="Moderation Focus",
-                value="moderation",
-                description="Staff actions and enforcement",
-                emoji="🔨"
-            ),
-            discord.SelectOption(
-                label="Community Focus",
-                value="community",
-                description="Member activity and engagement",
-                emoji="👥"
-            ),
-            discord.SelectOption(
-                label="Security Focus",
-                value="security",
-                description="Potential threats and violations",
-                emoji="🛡️"
-            )
-        ]
-        
-        self.add_item(PresetDropdown(options))
+        self.add_item(PresetDropdown(list(self._OPTIONS)))
 
 class PresetDropdown(discord.ui.Select):
     """Dropdown for preset selection."""
@@ -1510,108 +2051,47 @@ class PresetDropdown(discord.ui.Select):
     async def callback(self, interaction: discord.Interaction):
         preset = self.values[0]
         
-        # Define preset configurations
-        presets = {
-            "basic": {
-                "log_members": True, "log_moderation": True,
-                "log_roles": False, "log_avatars": False,
-                "log_voice": False, "log_messages": False, 
-                "log_server": False, "log_stage": False
-            },
-            "standard": {
-                "log_members": True, "log_roles": True, "log_avatars": False,
-                "log_moderation": True, "log_voice": False, 
-                "log_messages": True, "log_server": False, "log_stage": False
-            },
-            "comprehensive": {
-                "log_members": True, "log_roles": True, "log_avatars": True,
-                "log_moderation": True, "log_voice": True, 
-                "log_messages": True, "log_server": True, "log_stage": True
-            },
-            "moderation": {
-                "log_members": True, "log_roles": True, "log_avatars": False,
-                "log_moderation": True, "log_voice": True,
-                "log_messages": True, "log_server": False, "log_stage": False
-            },
-            "community": {
-                "log_members": True, "log_roles": True, "log_avatars": True,
-                "log_moderation": False, "log_voice": True, 
-                "log_messages": False, "log_server": False, "log_stage": True
-            },
-            "security": {
-                "log_members": True, "log_roles": True, "log_avatars": True,
-                "log_moderation": True, "log_voice": True,
-                "log_messages": True, "log_server": True, "log_stage": False
-            }
-        }
-        
         # Apply preset
-        if preset in presets:
-            await save_audit_settings(interaction.guild.id, **presets[preset])
-            
-            preset_names = {
-                "basic": "Basic Monitoring",
-                "standard": "Standard Configuration", 
-                "comprehensive": "Comprehensive Tracking",
-                "moderation": "Moderation Focus",
-                "community": "Community Focus",
-                "security": "Security Focus"
-            }
+        if preset in _PRESETS:
+            # Re-applying the active preset changes nothing; skip the write
+            current = await get_audit_settings(interaction.guild.id)
+            if all(current.get(key) == value for key, value in _PRESETS[preset].items()):
+                embed = discord.Embed(
+                    title="ℹ️ No Changes Made",
+                    description=f"**{_PRESET_NAMES[preset]}** is already your active configuration.",
+                    color=discord.Color.blue()
+                )
+                await interaction.response.edit_message(embed=embed, view=None)
+                return
+            
+            await save_audit_settings(interaction.guild.id, **_PRESETS[preset])
             
             embed = discord.Embed(
                 title="✅ Preset Applied Successfully",
-                description=f"**{preset_names[preset]}** configuration has been applied!",
+                description=f"**{_PRESET_NAMES[preset]}** configuration has been applied!",
                 color=discord.Color.green()
             )
             
             # Show what was enabled
-            enabled_features = []
-            disabled_features = []
-            
-            feature_names = {
-                "log_members": "Member Events",
-                "log_roles": "Role Changes", 
-                "log_avatars": "Avatar Changes",
-                "log_moderation": "Moderation Actions",
-                "log_voice": "Voice Activity",
-                "log_messages": "Message Events",
-                "log_server": "Server Events",
-                "log_stage": "Stage Events"
-            }
-            
-            for key, enabled in presets[preset].items():
-                if enabled:
-                    enabled_features.append(feature_names[key])
-                else:
-                    disabled_features.append(feature_names[key])
+            enabled_features, disabled_features = _PRESET_SUMMARIES[_PRESET_MASKS[preset]]
             
             if enabled_features:
                 embed.add_field(
                     name="✅ Enabled Features",
-                    value="• " + "\n• ".join(enabled_features),
+                    value=enabled_features,
                     inline=True
                 )
             
             if disabled_features:
                 embed.add_field(
                     name="❌ Disabled Features", 
-                    value="• " + "\n• ".join(disabled_features),
+                    value=disabled_features,
                     inline=True
                 )
             
-            # Add preset description
-            descriptions = {
-                "basic": "Essential monitoring with minimal noise",
-                "standard": "Balanced configuration for most servers",
-                "comprehensive": "Complete visibility into all server activity",
-                "moderation": "Focused on staff actions and enforcement",
-                "community": "Emphasizes member engagement and activity",
-                "security": "Enhanced monitoring for potential threats"
-            }
-            
             embed.add_field(
                 name="📋 Preset Description",
-                value=descriptions[preset],
+                value=_PRESET_DESCRIPTIONS[preset],
                 inline=False
             )
             
@@ -1629,29 +2109,7 @@ class DisableConfirmationView(discord.ui.View):
     async def confirm_disable(self, interaction: discord.Interaction, button: discord.ui.Button):
         await save_audit_settings(interaction.guild.id, enabled=False)
         
-        embed = discord.Embed(
-            title="🔴 Audit Logging System Disabled",
-            description="**The audit logging system has been successfully disabled.**\n\nAll event monitoring has been stopped.",
-            color=discord.Color.red()
-        )
-        
-        embed.add_field(
-            name="🔄 What happened:",
-            value=(
-                "• Event monitoring stopped immediately\n"
-                "• No new logs will be created\n"
-                "• Existing data remains intact\n"
-                "• All settings have been preserved"
-            ),
-            inline=False
-        )
-        
-        embed.add_field(
-            name="💡 To re-enable:",
-            value="Run `/auditconfig` and use the **🚀 Setup Now** button to restore functionality.",
-            inline=False
-        )
-        
+        embed = _DISABLED_EMBED_TEMPLATE.copy()
         embed.set_footer(text=f"Disabled by {interaction.user.display_name}")
         embed.timestamp = discord.utils.utcnow()
         
@@ -1659,19 +2117,7 @@ class DisableConfirmationView(discord.ui.View):
     
     @discord.ui.button(label="Cancel", style=discord.ButtonStyle.secondary, emoji="❌")
     async def cancel_disable(self, interaction: discord.Interaction, button: discord.ui.Button):
-        embed = discord.Embed(
-            title="✅ Action Cancelled",
-            description="**Audit logging remains active.**\n\nNo changes have been made to your configuration.",
-            color=discord.Color.green()
-        )
-        
-        embed.add_field(
-            name="🔍 System Status",
-            value="All monitoring features continue to operate normally.",
-            inline=False
-        )
-        
-        await interaction.response.edit_message(embed=embed, view=None)
+        await interaction.response.edit_message(embed=_DISABLE_CANCELLED_EMBED, view=None)
 
 # ========================= ADVANCED MODALS =========================
 
@@ -1703,8 +2149,6 @@ class ChannelSetupModal(discord.ui.Modal, title="🔧 Advanced Channel Configura
     )
     
     async def on_submit(self, interaction: discord.Interaction):
-        await interaction.response.defer()
-        
         # Parse channel
         channel_str = self.channel_input.value.strip()
         channel = await self.parse_channel(interaction.guild, channel_str)
@@ -1729,6 +2173,9 @@ class ChannelSetupModal(discord.ui.Modal, title="🔧 Advanced Channel Configura
             except ValueError:
                 retention_days = 30
         
+        # Validation passed; only the save and success post need a deferral
+        await interaction.response.defer(thinking=True)
+        
         # Save enhanced configuration
         await save_audit_settings(
             interaction.guild.id,
@@ -1739,245 +2186,124 @@ class ChannelSetupModal(discord.ui.Modal, title="🔧 Advanced Channel Configura
             **self.get_smart_defaults(interaction.guild)
         )
         
-        await self.send_success_message(interaction, channel, retention_days)
-        await self.send_welcome_message(channel, interaction.user)
+        success_embed = self.build_success_embed(interaction, channel, retention_days)
+        
+        # Set up from inside the audit channel: the followup lands there too,
+        # so carry the welcome embed in the same message
+        if interaction.channel_id == channel.id:
+            await interaction.followup.send(embeds=[success_embed, self.build_welcome_embed(interaction.user)])
+            return
+        
+        await interaction.followup.send(embed=success_embed)
+        
+        # The welcome post doesn't gate the interaction; send it in the background
+        task = asyncio.create_task(self.send_welcome_message(channel, interaction.user))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
     
     async def parse_channel(self, guild, channel_str):
         """Enhanced channel parsing with multiple formats."""
-        if channel_str.startswith('<#') and channel_str.endswith('>'):
-            try:
-                channel_id = int(channel_str[2:-1])
-                return guild.get_channel(channel_id)
-            except ValueError:
-                pass
-        elif channel_str.isdigit():
-            try:
-                return guild.get_channel(int(channel_str))
-            except ValueError:
-                pass
-        else:
-            channel_name = channel_str.lstrip('#')
-            return discord.utils.get(guild.text_channels, name=channel_name)
-        return None
+        match = _CHANNEL_REF_RE.fullmatch(channel_str)
+        if match is None:
+            return None
+        
+        channel_id = match[1] or match[2]
+        if channel_id:
+            return guild.get_channel(int(channel_id))
+        return discord.utils.get(guild.text_channels, name=match[3])
     
     async def check_permissions(self, channel, bot_member):
         """Comprehensive permission checking."""
-        permissions = channel.permissions_for(bot_member)
-        missing = []
-        
-        required_perms = [
-            ('view_channel', 'View Channel'),
-            ('send_messages', 'Send Messages'),
-            ('embed_links', 'Embed Links'),
-            ('read_message_history', 'Read Message History'),
-            ('attach_files', 'Attach Files'),
-            ('use_external_emojis', 'Use External Emojis')
-        ]
-        
-        for perm_name, display_name in required_perms:
-            if not getattr(permissions, perm_name, False):
-                missing.append(display_name)
-        
-        return missing
+        missing_bits = _SETUP_CHANNEL_MASK & ~channel.permissions_for(bot_member).value
+        if not missing_bits:
+            return []
+        return [display_name for bit, display_name in _SETUP_CHANNEL_PERMISSIONS if missing_bits & bit]
     
     def get_smart_defaults(self, guild):
         """Intelligent default settings based on server characteristics."""
-        member_count = guild.member_count
-        
-        if member_count < 50:
-            # Small server - enable everything for detailed monitoring
-            return {
-                'log_members': True, 'log_roles': True, 'log_avatars': True,
-                'log_voice': True, 'log_messages': True, 'log_server': True,
-                'log_moderation': True, 'log_stage': True
-            }
-        elif member_count < 500:
-            # Medium server - balanced approach
-            return {
-                'log_members': True, 'log_roles': True, 'log_avatars': False,
-                'log_voice': False, 'log_messages': True, 'log_server': True,
-                'log_moderation': True, 'log_stage': False
-            }
-        else:
-            # Large server - focus on important events
-            return {
-                'log_members': True, 'log_roles': True, 'log_avatars': False,
-                'log_voice': False, 'log_messages': True, 'log_server': True,
-                'log_moderation': True, 'log_stage': False
-            }
+        return _SMART_DEFAULTS_SMALL if guild.member_count < _SERVER_SIZE_THRESHOLDS[0] else _SMART_DEFAULTS_MEDIUM_LARGE
     
     async def send_channel_error(self, interaction):
         """Send channel not found error."""
-        embed = discord.Embed(
-            title="❌ Channel Not Found",
-            description="**Could not locate the specified channel.**\n\nPlease check the channel name or ID and try again.",
-            color=discord.Color.red()
-        )
-        embed.add_field(
-            name="💡 Valid formats:",
-            value=(
-                "• **Channel mention:** #audit-logs\n"
-                "• **Channel name:** audit-logs\n"
-                "• **Channel ID:** 123456789012345678"
-            ),
-            inline=False
-        )
-        embed.add_field(
-            name="🔍 Tips:",
-            value=(
-                "• Ensure the channel exists in this server\n"
-                "• Check spelling and capitalization\n"
-                "• Make sure I can see the channel"
-            ),
-            inline=False
-        )
-        await interaction.followup.send(embed=embed, ephemeral=True)
+        await interaction.response.send_message(embed=_CHANNEL_NOT_FOUND_EMBED, ephemeral=True)
     
     async def send_permission_error(self, interaction, channel, missing_perms):
         """Send permission error with helpful guidance."""
-        embed = discord.Embed(
-            title="❌ Insufficient Permissions",
-            description=f"**I'm missing required permissions in {channel.mention}:**",
-            color=discord.Color.red()
-        )
-        embed.add_field(
-            name="🔒 Missing Permissions:",
-            value="\n".join(f"• {perm}" for perm in missing_perms),
-            inline=False
-        )
-        embed.add_field(
-            name="💡 How to fix:",
-            value=(
-                "1. Go to Server Settings → Roles\n"
-                "2. Find my role and edit permissions\n"
-                "3. Enable the missing permissions\n"
-                "4. Or grant permissions directly in channel settings"
-            ),
-            inline=False
-        )
-        embed.add_field(
-            name="⚡ Quick Fix:",
-            value=f"Give me **Administrator** permission or **Manage Channels** in {channel.mention}",
-            inline=False
-        )
-        await interaction.followup.send(embed=embed, ephemeral=True)
+        embed = discord.Embed.from_dict({
+            "title": "❌ Insufficient Permissions",
+            "description": f"**I'm missing required permissions in {channel.mention}:**",
+            "color": discord.Color.red().value,
+            "fields": [
+                {"name": "🔒 Missing Permissions:", "value": "• " + "\n• ".join(missing_perms), "inline": False},
+                {
+                    "name": "💡 How to fix:",
+                    "value": (
+                        "1. Go to Server Settings → Roles\n"
+                        "2. Find my role and edit permissions\n"
+                        "3. Enable the missing permissions\n"
+                        "4. Or grant permissions directly in channel settings"
+                    ),
+                    "inline": False,
+                },
+                {
+                    "name": "⚡ Quick Fix:",
+                    "value": f"Give me **Administrator** permission or **Manage Channels** in {channel.mention}",
+                    "inline": False,
+                },
+            ],
+        })
+        await interaction.response.send_message(embed=embed, ephemeral=True)
     
-    async def send_success_message(self, interaction, channel, retention_days):
-        """Send comprehensive success message."""
-        embed = discord.Embed(
-            title="✅ Audit System Configured Successfully",
-            description=f"🎉 **Congratulations!** Your advanced audit logging system is now active in {channel.mention}",
-            color=discord.Color.green()
-        )
-        
-        # Configuration summary
-        embed.add_field(
-            name="⚙️ Configuration Applied:",
-            value=(
-                f"📍 **Channel:** {channel.mention}\n"
-                f"🗓️ **Retention:** {retention_days} days\n"
-                f"🤖 **Smart Defaults:** Applied based on server size\n"
-                f"🔧 **Advanced Features:** Enabled"
-            ),
-            inline=False
-        )
-        
+    def build_success_embed(self, interaction, channel, retention_days):
+        """Build comprehensive success message."""
         # Intelligent features based on server
-        server_size = "Small" if interaction.guild.member_count < 50 else "Medium" if interaction.guild.member_count < 500 else "Large"
-        
-        embed.add_field(
-            name=f"🎯 Optimized for {server_size} Server:",
-            value=(
-                f"**Member Count:** {interaction.guild.member_count:,}\n"
-                f"**Configuration:** {server_size}-server optimized\n"
-                f"**Performance:** Balanced for your needs\n"
-                f"**Features:** Intelligently selected"
-            ),
-            inline=True
-        )
-        
-        # Next steps
-        embed.add_field(
-            name="🚀 Next Steps:",
-            value=(
-                "• Use **⚙️ Features** to customize what's logged\n"
-                "• Try **🧪 Test** to verify everything works\n"
-                "• Check **📊 Analytics** for insights\n"
-                "• Explore **🔧 Advanced Options** for power features"
-            ),
-            inline=True
-        )
-        
-        embed.set_footer(text=f"Configured by {interaction.user.display_name} • System ready!")
+        member_count = interaction.guild.member_count
+        server_size = _SERVER_SIZE_LABELS[bisect.bisect_right(_SERVER_SIZE_THRESHOLDS, member_count)]
+        
+        embed = discord.Embed.from_dict({
+            "title": "✅ Audit System Configured Successfully",
+            "description": _SETUP_SUCCESS_DESCRIPTION.format(channel=channel.mention),
+            "color": discord.Color.green().value,
+            "fields": [
+                # Configuration summary
+                {
+                    "name": "⚙️ Configuration Applied:",
+                    "value": _SETUP_CONFIG_TEMPLATE.format(channel=channel.mention, days=retention_days),
+                    "inline": False,
+                },
+                {
+                    "name": f"🎯 Optimized for {server_size} Server:",
+                    "value": _SETUP_SIZE_TEMPLATE.format(members=member_count, size=server_size),
+                    "inline": True,
+                },
+                # Next steps
+                {
+                    "name": "🚀 Next Steps:",
+                    "value": (
+                        "• Use **⚙️ Features** to customize what's logged\n"
+                        "• Try **🧪 Test** to verify everything works\n"
+                        "• Check **📊 Analytics** for insights\n"
+                        "• Explore **🔧 Advanced Options** for power features"
+                    ),
+                    "inline": True,
+                },
+            ],
+            "footer": {"text": f"Configured by {interaction.user.display_name} • System ready!"},
+        })
         embed.timestamp = discord.utils.utcnow()
-        
-        await interaction.followup.send(embed=embed)
+        return embed
     
-    async def send_welcome_message(self, channel, user):
-        """Send enhanced welcome message to audit channel."""
-        embed = discord.Embed(
-            title="🔍 Advanced Audit Logging System Activated",
-            description="**Welcome to your intelligent audit monitoring center!**\n\nThis channel will receive comprehensive, AI-enhanced audit logs for your server.",
-            color=discord.Color.blue()
-        )
-        
-        embed.add_field(
-            name="🎯 What you'll see here:",
-            value=(
-                "• **Member Activity** - Joins, leaves, role changes with context\n"
-                "• **Moderation Actions** - Bans, kicks, mutes, disconnects with moderator detection\n"
-                "• **Voice Tracking** - Channel activity with session analytics\n"
-                "• **Message Events** - Edits, deletions with content preservation\n"
-                "• **Server Changes** - Channel and role modifications\n"
-                "• **Avatar Updates** - Member avatar changes with preview\n"
-                "• **Security Alerts** - Potential threats and violations"
-            ),
-            inline=False
-        )
-        
-        embed.add_field(
-            name="✨ Advanced Features:",
-            value=(
-                "🧠 **AI-Powered Detection** - Smart pattern recognition\n"
-                "🕵️ **Advanced Moderator Detection** - Identifies who performed actions\n"
-                "🔌 **Disconnect Tracking** - See who disconnected members from voice\n"
-                "⏱️ **Real-time Session Tracking** - Voice call duration monitoring\n"
-                "💾 **Content Preservation** - Saves deleted messages securely\n"
-                "🖼️ **Avatar History** - Visual tracking of profile changes\n"
-                "📊 **Intelligent Analytics** - Trend analysis and insights\n"
-                "🔍 **Smart Filtering** - Reduces noise, highlights important events\n"
-                "🛡️ **Security Monitoring** - Automated threat detection"
-            ),
-            inline=False
-        )
-        
-        embed.add_field(
-            name="⚡ Performance Features:",
-            value=(
-                "• **Real-time Processing** - Instant event detection\n"
-                "• **Smart Batching** - Efficient bulk operations\n"
-                "• **Automatic Optimization** - Self-tuning performance\n"
-                "• **Intelligent Caching** - Reduced server load"
-            ),
-            inline=True
-        )
-        
-        embed.add_field(
-            name="🔧 Management:",
-            value=(
-                "• **Easy Configuration** - `/auditconfig` command\n"
-                "• **Granular Control** - Toggle individual features\n"
-                "• **Custom Presets** - Quick setup options\n"
-                "• **Advanced Analytics** - Detailed reporting"
-            ),
-            inline=True
-        )
-        
+    def build_welcome_embed(self, user):
+        """Build enhanced welcome message for the audit channel."""
+        embed = _WELCOME_EMBED_TEMPLATE.copy()
         embed.set_footer(text=f"Configured by {user.display_name} • Use /auditconfig to modify settings")
         embed.timestamp = discord.utils.utcnow()
-        
+        return embed
+    
+    async def send_welcome_message(self, channel, user):
+        """Send enhanced welcome message to audit channel."""
         try:
-            await channel.send(embed=embed)
+            await channel.send(embed=self.build_welcome_embed(user))
         except:
             pass  # Don't fail if we can't send welcome message
 
@@ -2022,6 +2348,17 @@ class RetentionModal(discord.ui.Modal, title="🗓️ Advanced Data Retention Co
         if cleanup_freq not in ["daily", "weekly", "monthly"]:
             cleanup_freq = "daily"
         
+        # Unchanged retention needs no write or fresh analysis
+        current = await get_audit_settings(interaction.guild.id)
+        if days == current.get('retention_days'):
+            embed = discord.Embed(
+                title="ℹ️ No Changes Made",
+                description=f"📅 Retention is already set to **{days} days**.",
+                color=discord.Color.blue()
+            )
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+            return
+        
         # Save configuration
         await save_audit_settings(interaction.guild.id, retention_days=days)
         
@@ -2057,22 +2394,9 @@ class RetentionModal(discord.ui.Modal, title="🗓️ Advanced Data Retention Co
     
     def add_retention_analysis(self, embed, days, member_count):
         """Add intelligent retention analysis."""
-        if days <= 7:
-            analysis = "⚠️ **Short-term retention** - Good for testing or high-activity servers"
-            recommendation = "Consider 14-30 days for better trend analysis"
-            color_indicator = "🟡"
-        elif days <= 30:
-            analysis = "✅ **Standard retention** - Excellent balance of storage and utility"
-            recommendation = "Optimal for most servers"
-            color_indicator = "🟢"
-        elif days <= 90:
-            analysis = "📊 **Extended retention** - Great for compliance and detailed analysis"
-            recommendation = "Perfect for servers requiring detailed audit trails"
-            color_indicator = "🔵"
-        else:
-            analysis = "🗄️ **Long-term retention** - Maximum data preservation"
-            recommendation = "Monitor storage usage regularly"
-            color_indicator = "🟣"
+        color_indicator, analysis, recommendation = _RETENTION_TIERS[
+            bisect.bisect_left(_RETENTION_THRESHOLDS, days)
+        ]
         
         # Adjust recommendations based on server size
         if member_count > 1000 and days > 90:
@@ -2089,45 +2413,37 @@ class RetentionModal(discord.ui.Modal, title="🗓️ Advanced Data Retention Co
     async def add_storage_impact(self, embed, days, guild_id):
         """Add storage impact analysis."""
         try:
-            from config import DB_PATH
-            import aiosqlite
-            
-            async with aiosqlite.connect(DB_PATH) as db:
-                # Get current log count
-                async with db.execute("SELECT COUNT(*) FROM audit_logs WHERE guild_id = ?", (guild_id,)) as cursor:
-                    current_logs = (await cursor.fetchone())[0]
-                
-                # Estimate daily activity (rough calculation)
-                if current_logs > 0:
-                    # Get oldest log to estimate daily rate
-                    async with db.execute(
-                        "SELECT timestamp FROM audit_logs WHERE guild_id = ? ORDER BY timestamp ASC LIMIT 1", 
-                        (guild_id,)
-                    ) as cursor:
-                        oldest = await cursor.fetchone()
+            # Current log count from the trigger-maintained counter, plus the
+            # oldest log (an index probe, as unix seconds) to estimate the daily rate
+            rows = await fetch_all("""
+                SELECT (SELECT total FROM audit_counters WHERE guild_id = ?),
+                       (SELECT CAST(strftime('%s', MIN(timestamp)) AS INTEGER)
+                          FROM audit_logs WHERE guild_id = ?)
+            """, (guild_id, guild_id))
+            current_logs, oldest = rows[0]
+            current_logs = current_logs or 0
+            
+            # Estimate daily activity (rough calculation)
+            if current_logs > 0 and oldest:
+                try:
+                    days_tracked = (int(time.time()) - oldest) // 86400 or 1
+                    daily_avg = current_logs / days_tracked
                     
-                    if oldest:
-                        from datetime import datetime
-                        try:
-                            oldest_date = datetime.fromisoformat(oldest[0])
-                            days_tracked = (datetime.utcnow() - oldest_date).days or 1
-                            daily_avg = current_logs / days_tracked
-                            
-                            # Project storage for new retention period
-                            projected_logs = int(daily_avg * days)
-                            
-                            embed.add_field(
-                                name="💾 Storage Impact",
-                                value=(
-                                    f"**Current logs:** {current_logs:,}\n"
-                                    f"**Daily average:** {daily_avg:.1f}\n"
-                                    f"**Projected total:** {projected_logs:,}\n"
-                                    f"**Storage trend:** {'🟢 Optimal' if projected_logs < 10000 else '🟡 Moderate' if projected_logs < 50000 else '🔴 High'}"
-                                ),
-                                inline=True
-                            )
-                        except:
-                            pass
+                    # Project storage for new retention period
+                    projected_logs = int(daily_avg * days)
+                    
+                    embed.add_field(
+                        name="💾 Storage Impact",
+                        value=(
+                            f"**Current logs:** {current_logs:,}\n"
+                            f"**Daily average:** {daily_avg:.1f}\n"
+                            f"**Projected total:** {projected_logs:,}\n"
+                            f"**Storage trend:** {'🟢 Optimal' if projected_logs < 10000 else '🟡 Moderate' if projected_logs < 50000 else '🔴 High'}"
+                        ),
+                        inline=True
+                    )
+                except:
+                    pass
         except:
             embed.add_field(
                 name="💾 Storage Impact",
@@ -2171,7 +2487,7 @@ class LogSearchModal(discord.ui.Modal, title="🔍 Advanced Log Search"):
     
     search_query = discord.ui.TextInput(
         label="🔍 Search Query",
-        placeholder="Enter username, action type, or keyword",
+        placeholder='name, name* for prefixes, or "exact phrase"',
         required=True,
         max_length=100,
         style=discord.TextStyle.short
@@ -2187,7 +2503,7 @@ class LogSearchModal(discord.ui.Modal, title="🔍 Advanced Log Search"):
     
     event_types = discord.ui.TextInput(
         label="🎯 Event Types",
-        placeholder="e.g., bans, kicks, joins, messages, avatar_change (comma-separated)",
+        placeholder="e.g., member_ban, member_kick, member_join, avatar_change (comma-separated)",
         required=False,
         max_length=100,
         style=discord.TextStyle.short
@@ -2204,58 +2520,85 @@ class LogSearchModal(discord.ui.Modal, title="🔍 Advanced Log Search"):
     
     async def perform_search(self, guild_id):
         """Perform advanced database search."""
-        from config import DB_PATH
-        import aiosqlite
-        
-        # Build dynamic query
-        query_parts = ["SELECT event_type, user_name, target_name, moderator_name, timestamp, before_value, after_value FROM audit_logs WHERE guild_id = ?"]
-        params = [guild_id]
-        
-        # Add search filters
-        if self.search_query.value:
-            query_parts.append("AND (user_name LIKE ? OR target_name LIKE ? OR moderator_name LIKE ? OR before_value LIKE ? OR after_value LIKE ?)")
-            search_term = f"%{self.search_query.value}%"
-            params.extend([search_term, search_term, search_term, search_term, search_term])
+        term = self.search_query.value.strip()
+        params = []
         
         # Add date range filter
-        if self.date_range.value:
-            date_filter = self.parse_date_range(self.date_range.value)
-            if date_filter:
-                query_parts.append("AND timestamp >= ?")
-                params.append(date_filter)
+        date_filter = self.parse_date_range(self.date_range.value) if self.date_range.value else None
+        if date_filter:
+            params.append(date_filter)
         
-        # Add event type filter
+        # Add event type filter; names outside the logger's vocabulary can never match
+        event_list = []
         if self.event_types.value:
-            event_list = [event.strip() for event in self.event_types.value.split(',')]
-            if event_list:
-                placeholders = ','.join(['?'] * len(event_list))
-                query_parts.append(f"AND event_type IN ({placeholders})")
-                params.extend(event_list)
-        
-        query_parts.append("ORDER BY timestamp DESC LIMIT 20")
-        
-        async with aiosqlite.connect(DB_PATH) as db:
-            async with db.execute(' '.join(query_parts), params) as cursor:
-                return await cursor.fetchall()
+            requested = [event.strip().lower() for event in self.event_types.value.split(',') if event.strip()]
+            event_list = [event for event in requested if event in AUDIT_EVENT_TYPES]
+            if requested and not event_list:
+                raise ValueError(f"No known event types in: {', '.join(requested)}\nUse names like member_ban, message_delete or role_add")
+        params.extend(event_list)
+        
+        async with db_connection() as db:
+            async def run(predicate, predicate_params):
+                query = _search_sql(predicate, bool(date_filter), len(event_list))
+                async with db.execute(query, [guild_id, *predicate_params, *params]) as cursor:
+                    return await cursor.fetchall()
+            
+            # Rows by id, in rank order: name hits first, then the wider search
+            results = {}
+            limit = SEARCH_RESULTS_SHOWN + 1
+            
+            def add(rows):
+                for row in rows:
+                    if len(results) >= limit:
+                        break
+                    results.setdefault(row[0], row[1:])
+            
+            if not term:
+                add(await run("", ()))
+                return list(results.values())
+            
+            # A bare word is often a whole name: index seeks on the name
+            # columns rank those rows first
+            if _BARE_WORD_RE.fullmatch(term):
+                add(await run(_NAME_EQUALS_PREDICATE, (term,) * 3))
+            
+            # Likewise name* ranks a range seek on the NOCASE name indexes first,
+            # which a case-insensitive LIKE 'name%' could never use
+            prefix = term.rstrip('*')
+            name_range = _prefix_range(prefix) if prefix != term and _BARE_WORD_RE.fullmatch(prefix) else None
+            if name_range:
+                add(await run(_NAME_PREFIX_PREDICATE, name_range * 3))
+            
+            # The remaining slots come from the full-text search
+            if len(results) < limit:
+                try:
+                    add(await run(_FTS_PREDICATE, (_fts_query(term),)))
+                except aiosqlite.OperationalError:
+                    # No full-text index on this database; fall back to LIKE, anchored for name*
+                    if term.endswith('*'):
+                        pattern = term.rstrip('*') + '%'
+                    else:
+                        pattern = '%' + term.strip('"') + '%'
+                    add(await run(_LIKE_PREDICATE, (pattern,) * 5))
+            
+            return list(results.values())
     
     def parse_date_range(self, date_str):
         """Parse various date range formats."""
-        from datetime import datetime, timedelta
-        
         date_str = date_str.lower().strip()
         
         if date_str.endswith('d'):
             # Days ago (e.g., 7d)
             try:
                 days = int(date_str[:-1])
-                return (datetime.utcnow() - timedelta(days=days)).isoformat()
+                return _cutoff_iso(days=days)
             except ValueError:
                 pass
         elif date_str.endswith('h'):
             # Hours ago (e.g., 24h)
             try:
                 hours = int(date_str[:-1])
-                return (datetime.utcnow() - timedelta(hours=hours)).isoformat()
+                return _cutoff_iso(hours=hours)
             except ValueError:
                 pass
         elif 'to' in date_str:
@@ -2287,25 +2630,23 @@ class LogSearchModal(discord.ui.Modal, title="🔍 Advanced Log Search"):
                 inline=False
             )
         else:
+            more_results = len(results) > SEARCH_RESULTS_SHOWN
+            found = f"{SEARCH_RESULTS_SHOWN}+" if more_results else len(results)
             embed = discord.Embed(
                 title="🔍 Advanced Search Results",
-                description=f"**Found {len(results)} matching audit log entries**\n\nDisplaying most recent matches:",
+                description=f"**Found {found} matching audit log entries**\n\nDisplaying most recent matches:",
                 color=discord.Color.blue()
             )
             
-            for i, result in enumerate(results[:10], 1):
-                event_type, user_name, target_name, moderator_name, timestamp, before_value, after_value = result
+            for i, result in enumerate(results[:SEARCH_RESULTS_SHOWN], 1):
+                event_type, user_name, target_name, moderator_name, ts_epoch, before_value, after_value = result
                 
                 # Format timestamp
-                try:
-                    from datetime import datetime
-                    dt = datetime.fromisoformat(timestamp)
-                    time_str = f"<t:{int(dt.timestamp())}:R>"
-                except:
-                    time_str = timestamp
+                time_str = f"<t:{ts_epoch}:R>" if ts_epoch is not None else "Unknown time"
                 
                 # Build result description
-                description = f"**{event_type.replace('_', ' ').title()}**"
+                event_name = _pretty_event(event_type)
+                description = f"**{event_name}**"
                 if user_name:
                     description += f" by {user_name}"
                 if target_name and target_name != user_name:
@@ -2315,21 +2656,20 @@ class LogSearchModal(discord.ui.Modal, title="🔍 Advanced Log Search"):
                 
                 if before_value or after_value:
                     if before_value and after_value:
-                        description += f"\n*Before:* {before_value[:50]}{'...' if len(str(before_value)) > 50 else ''}"
-                        description += f"\n*After:* {after_value[:50]}{'...' if len(str(after_value)) > 50 else ''}"
+                        description += f"\n*Before:* {_truncate(before_value, 50)}\n*After:* {_truncate(after_value, 50)}"
                     elif before_value:
-                        description += f"\n*Content:* {before_value[:100]}{'...' if len(str(before_value)) > 100 else ''}"
+                        description += f"\n*Content:* {_truncate(before_value, 100)}"
                     elif after_value:
-                        description += f"\n*Value:* {after_value[:100]}{'...' if len(str(after_value)) > 100 else ''}"
+                        description += f"\n*Value:* {_truncate(after_value, 100)}"
                 
                 embed.add_field(
-                    name=f"{i}. {event_type.replace('_', ' ').title()} • {time_str}",
+                    name=f"{i}. {event_name} • {time_str}",
                     value=description,
                     inline=False
                 )
             
-            if len(results) > 10:
-                embed.set_footer(text=f"Showing 10 of {len(results)} results • Refine search for fewer results")
+            if more_results:
+                embed.set_footer(text=f"Showing {SEARCH_RESULTS_SHOWN} of {found} results • Refine search for fewer results")
             else:
                 embed.set_footer(text=f"Total results: {len(results)}")
         
@@ -2363,6 +2703,9 @@ class AuditConfigCommands(commands.Cog):
         self.bot = bot
         print("🔍✨ Amazing AuditConfigCommands cog initialized with advanced features!")
     
+    async def cog_unload(self):
+        await close_db_pool()
+    
     @app_commands.command(name="auditconfig", description="🔍✨ Advanced audit logging control panel")
     async def auditconfig(self, interaction: discord.Interaction):
         """Main audit configuration command with comprehensive features."""
@@ -2482,10 +2825,8 @@ class AuditConfigCommands(commands.Cog):
     
     async def get_feature_summary(self, settings):
         """Get intelligent feature summary."""
-        total_features = 8
-        enabled_features = sum(1 for key in ['log_members', 'log_roles', 'log_avatars', 'log_moderation', 
-                                            'log_messages', 'log_voice', 'log_server', 'log_stage'] 
-                              if settings.get(key, True))
+        total_features = len(_FEATURE_KEYS)
+        enabled_features = feature_mask(settings).bit_count()
         
         percentage = (enabled_features / total_features) * 100
         
@@ -2502,66 +2843,51 @@ class AuditConfigCommands(commands.Cog):
     
     async def get_performance_metrics(self, guild_id):
         """Get real-time performance metrics."""
+        cached = cached_dashboard_stat('performance', guild_id)
+        if cached is not None:
+            return cached
+        
         try:
-            from config import DB_PATH
-            import aiosqlite
-            import time
-            
-            start_time = time.time()
-            async with aiosqlite.connect(DB_PATH) as db:
-                async with db.execute("SELECT COUNT(*) FROM audit_logs WHERE guild_id = ?", (guild_id,)) as cursor:
-                    record_count = (await cursor.fetchone())[0]
-            query_time = (time.time() - start_time) * 1000
+            record_count, _, query_time = await get_dashboard_counts(guild_id)
             
             performance_status = "🟢 Excellent" if query_time < 50 else "🟡 Good" if query_time < 200 else "🔴 Slow"
             
-            return f"**Database:** {performance_status}\n**Records:** {record_count:,}\n**Query Time:** {query_time:.1f}ms"
+            return cache_dashboard_stat(
+                'performance', guild_id,
+                f"**Database:** {performance_status}\n**Records:** {record_count:,}\n**Query Time:** {query_time:.1f}ms"
+            )
         except:
             return "**Database:** 🟢 Optimal\n**Performance:** Excellent\n**Response:** < 50ms"
     
     async def get_quick_statistics(self, guild_id):
         """Get quick statistics summary."""
+        cached = cached_dashboard_stat('statistics', guild_id)
+        if cached is not None:
+            return cached
+        
         try:
-            from config import DB_PATH
-            import aiosqlite
-            from datetime import datetime, timedelta
-            
-            async with aiosqlite.connect(DB_PATH) as db:
-                # Last 24h activity
-                yesterday = (datetime.utcnow() - timedelta(hours=24)).isoformat()
-                async with db.execute("SELECT COUNT(*) FROM audit_logs WHERE guild_id = ? AND timestamp > ?", (guild_id, yesterday)) as cursor:
-                    recent_activity = (await cursor.fetchone())[0]
-                
-                # Total events
-                async with db.execute("SELECT COUNT(*) FROM audit_logs WHERE guild_id = ?", (guild_id,)) as cursor:
-                    total_events = (await cursor.fetchone())[0]
+            total_events, recent_activity, _ = await get_dashboard_counts(guild_id)
             
-            return f"**Last 24h:** {recent_activity:,} events\n**Total Events:** {total_events:,}\n**Status:** 🟢 Active"
+            return cache_dashboard_stat(
+                'statistics', guild_id,
+                f"**Last 24h:** {recent_activity:,} events\n**Total Events:** {total_events:,}\n**Status:** 🟢 Active"
+            )
         except:
             return "**Activity:** 🟢 Healthy\n**Monitoring:** Active\n**Data:** Available"
     
     async def fetch_filtered_logs(self, guild_id, limit, event_type, user):
         """Fetch logs with advanced filtering."""
-        from config import DB_PATH
-        import aiosqlite
-        
-        query_parts = ["SELECT event_type, user_name, target_name, moderator_name, timestamp, before_value, after_value FROM audit_logs WHERE guild_id = ?"]
         params = [guild_id]
         
         if event_type:
-            query_parts.append("AND event_type = ?")
             params.append(event_type)
         
         if user:
-            query_parts.append("AND (user_id = ? OR target_id = ?)")
             params.extend([user.id, user.id])
         
-        query_parts.append("ORDER BY timestamp DESC LIMIT ?")
         params.append(limit)
         
-        async with aiosqlite.connect(DB_PATH) as db:
-            async with db.execute(' '.join(query_parts), params) as cursor:
-                return await cursor.fetchall()
+        return await fetch_all(_FILTERED_LOGS_SQL[bool(event_type), bool(user)], params)
     
     async def send_log_results(self, interaction, logs, limit, event_type, user):
         """Send formatted log results with advanced formatting."""
@@ -2590,47 +2916,32 @@ class AuditConfigCommands(commands.Cog):
             )
             
             for i, log in enumerate(logs[:10], 1):
-                event_type_str, user_name, target_name, moderator_name, timestamp, before_value, after_value = log
+                event_type_str, user_name, target_name, moderator_name, ts_epoch, before_value, after_value = log
                 
                 # Enhanced timestamp formatting
-                try:
-                    from datetime import datetime
-                    dt = datetime.fromisoformat(timestamp)
-                    time_str = f"<t:{int(dt.timestamp())}:R>"
-                except:
-                    time_str = timestamp
+                time_str = f"<t:{ts_epoch}:R>" if ts_epoch is not None else "Unknown time"
                 
                 # Smart description building
-                description = f"**{event_type_str.replace('_', ' ').title()}**"
+                event_name = _pretty_event(event_type_str)
                 
                 actors = []
                 if user_name: actors.append(f"by {user_name}")
                 if target_name and target_name != user_name: actors.append(f"→ {target_name}")
-                if moderator_name and moderator_name not in [user_name, target_name]: actors.append(f"(mod: {moderator_name})")
+                if moderator_name and moderator_name not in (user_name, target_name): actors.append(f"(mod: {moderator_name})")
                 
-                if actors:
-                    description += f" {' '.join(actors)}"
+                lines = [f"**{event_name}** {' '.join(actors)}" if actors else f"**{event_name}**"]
                 
                 # Add content preview for certain events
-                if event_type_str in ['message_delete', 'message_edit', 'avatar_change']:
-                    if before_value:
-                        description += f"\n*Before:* {str(before_value)[:50]}{'...' if len(str(before_value)) > 50 else ''}"
-                    if after_value:
-                        description += f"\n*After:* {str(after_value)[:50]}{'...' if len(str(after_value)) > 50 else ''}"
-                
-                # Event type emoji mapping
-                emoji_map = {
-                    "member_join": "👋", "member_leave": "👋", "member_ban": "🔨",
-                    "member_kick": "🦵", "role_add": "➕", "role_remove": "➖",
-                    "message_delete": "🗑️", "message_edit": "📝", "voice_join": "🔊",
-                    "voice_disconnect": "🔌", "avatar_change": "🖼️"
-                }
+                if event_type_str in _CONTENT_PREVIEW_EVENTS:
+                    for label, value in (("Before", before_value), ("After", after_value)):
+                        if value:
+                            lines.append(f"*{label}:* {_truncate(value, 50)}")
                 
-                emoji = emoji_map.get(event_type_str, "📝")
+                emoji = _EVENT_EMOJI.get(event_type_str, "📝")
                 
                 embed.add_field(
-                    name=f"{emoji} {i}. {event_type_str.replace('_', ' ').title()} • {time_str}",
-                    value=description,
+                    name=f"{emoji} {i}. {event_name} • {time_str}",
+                    value="\n".join(lines),
                     inline=False
                 )
             
@@ -2649,23 +2960,7 @@ class AuditConfigCommands(commands.Cog):
     
     async def send_access_denied(self, interaction):
         """Send enhanced access denied message."""
-        embed = discord.Embed(
-            title="🔒 Access Denied",
-            description="**You don't have permission to use the advanced audit system.**",
-            color=discord.Color.red()
-        )
-        embed.add_field(
-            name="🎭 Required Roles",
-            value="\n".join(f"• `{role}`" for role in ALLOWED_MANAGEMENT_ROLES),
-            inline=False
-        )
-        embed.add_field(
-            name="💡 Need Access?",
-            value="Contact a server administrator to get the required permissions.",
-            inline=False
-        )
-        embed.set_footer(text="Advanced audit system - Permission required")
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await interaction.response.send_message(embed=_ACCESS_DENIED_EMBED, ephemeral=True)
     
     async def send_log_error(self, interaction, error):
         """Send log viewing error."""
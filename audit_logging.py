@@ -6,6 +6,7 @@ import aiosqlite
 import asyncio
 import json
 import sqlite3
+import time
 from typing import Optional, Dict, Any, List
 
 # Import configuration
@@ -19,6 +20,30 @@ except ImportError:
 # Global bot reference for sending embeds
 _bot_instance = None
 
+# Per-guild audit settings cache: guild_id -> (expires_at, settings)
+AUDIT_SETTINGS_TTL = 30
+_audit_settings_cache: Dict[int, tuple] = {}
+
+# Feature flags packed into audit_settings.feature_mask, one bit each in this order
+FEATURE_FLAG_KEYS = ('log_members', 'log_roles', 'log_avatars', 'log_moderation',
+                     'log_messages', 'log_voice', 'log_server', 'log_stage')
+FEATURE_MASK_ALL = (1 << len(FEATURE_FLAG_KEYS)) - 1
+_FEATURE_MASK_SQL = " | ".join(f"(IFNULL({key}, 0) << {i})" for i, key in enumerate(FEATURE_FLAG_KEYS))
+
+# Event types by the log_<category> flag that gates them
+EVENT_CATEGORIES = {
+    'moderation': ('member_ban', 'member_unban', 'member_kick', 'member_timeout', 'member_untimeout', 'voice_disconnect'),
+    'messages': ('message_delete', 'message_edit', 'message_bulk_delete'),
+    'voice': ('voice_join', 'voice_leave', 'voice_move', 'voice_mute', 'voice_unmute', 'voice_deafen', 'voice_undeafen', 'voice_disconnect'),
+    'members': ('member_join', 'member_leave', 'member_update', 'nickname_change', 'avatar_change'),
+    'roles': ('role_add', 'role_remove', 'role_create', 'role_delete', 'role_update'),
+    'server': ('channel_create', 'channel_delete', 'channel_update', 'emoji_create', 'emoji_delete', 'emoji_update', 'guild_update'),
+    'stage': ('stage_speaker_add', 'stage_speaker_remove', 'stage_listener_add', 'stage_invite_sent', 'stage_request_speak', 'stage_start', 'stage_end'),
+    'avatars': ('avatar_change',)
+}
+# Every event type log_audit_event can store
+AUDIT_EVENT_TYPES = frozenset(event for events in EVENT_CATEGORIES.values() for event in events)
+
 # ========================= DATABASE SETUP =========================
 
 async def init_audit_logs_table():
@@ -82,6 +107,15 @@ async def init_audit_logs_table():
                     await db.execute("UPDATE audit_logs SET event_type = 'legacy_event' WHERE event_type IS NULL")
                     print("✅ Updated existing records with default event_type")
             
+            # Unix-seconds view of the ISO timestamp, computed on read, for Discord <t:...> tags
+            async with db.execute("PRAGMA table_xinfo(audit_logs)") as cursor:
+                has_ts_epoch = any(col[1] == 'ts_epoch' for col in await cursor.fetchall())
+            if not has_ts_epoch:
+                await db.execute(
+                    "ALTER TABLE audit_logs ADD COLUMN ts_epoch INTEGER GENERATED ALWAYS AS (CAST(strftime('%s', timestamp) AS INTEGER)) VIRTUAL"
+                )
+                print("✅ Added column: ts_epoch")
+            
             # Check audit_settings table structure
             async with db.execute("PRAGMA table_info(audit_settings)") as cursor:
                 settings_columns = await cursor.fetchall()
@@ -130,6 +164,15 @@ async def init_audit_logs_table():
                         except Exception as e:
                             print(f"⚠️ Could not add settings column {base_column_name}: {e}")
             
+            # Packed feature flags, derived from the log_* columns so writes stay unchanged
+            async with db.execute("PRAGMA table_xinfo(audit_settings)") as cursor:
+                has_feature_mask = any(col[1] == 'feature_mask' for col in await cursor.fetchall())
+            if not has_feature_mask:
+                await db.execute(
+                    f"ALTER TABLE audit_settings ADD COLUMN feature_mask INTEGER GENERATED ALWAYS AS ({_FEATURE_MASK_SQL}) VIRTUAL"
+                )
+                print("✅ Added settings column: feature_mask")
+            
             # Create voice sessions table
             await db.execute("""
                 CREATE TABLE IF NOT EXISTS voice_sessions (
@@ -150,9 +193,132 @@ async def init_audit_logs_table():
             # Create indexes for performance
             await db.execute("CREATE INDEX IF NOT EXISTS idx_audit_guild_timestamp ON audit_logs(guild_id, timestamp)")
             await db.execute("CREATE INDEX IF NOT EXISTS idx_audit_event_type ON audit_logs(event_type)")
+            # Event-type filtered feeds read newest-first straight off the index;
+            # supersedes the (guild_id, event_type) one
+            await db.execute("DROP INDEX IF EXISTS idx_audit_guild_event")
+            await db.execute("CREATE INDEX IF NOT EXISTS idx_audit_guild_type_ts ON audit_logs(guild_id, event_type, timestamp)")
+            # With idx_audit_guild_user_name, lets the planner answer user_id = ? OR target_id = ? via a multi-index OR
+            await db.execute("CREATE INDEX IF NOT EXISTS idx_audit_guild_target ON audit_logs(guild_id, target_id)")
+            # Exact-name log searches (case-insensitive) seek these instead of scanning
+            await db.execute("CREATE INDEX IF NOT EXISTS idx_audit_guild_user_nocase ON audit_logs(guild_id, user_name COLLATE NOCASE)")
+            await db.execute("CREATE INDEX IF NOT EXISTS idx_audit_guild_target_nocase ON audit_logs(guild_id, target_name COLLATE NOCASE)")
+            await db.execute("CREATE INDEX IF NOT EXISTS idx_audit_guild_moderator_nocase ON audit_logs(guild_id, moderator_name COLLATE NOCASE)")
+            # Covering index for the top-users query; supersedes the (guild_id, user_id) one
+            await db.execute("DROP INDEX IF EXISTS idx_audit_guild_user")
+            await db.execute("CREATE INDEX IF NOT EXISTS idx_audit_guild_user_name ON audit_logs(guild_id, user_id, user_name)")
             await db.execute("CREATE INDEX IF NOT EXISTS idx_voice_sessions_active ON voice_sessions(guild_id, is_active)")
             
+            # Per-guild row counts kept in step with audit_logs by triggers
+            async with db.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'audit_counters'") as cursor:
+                has_counters = await cursor.fetchone()
+            if not has_counters:
+                await db.execute("CREATE TABLE audit_counters (guild_id INTEGER PRIMARY KEY, total INTEGER NOT NULL DEFAULT 0)")
+                await db.execute("INSERT INTO audit_counters (guild_id, total) SELECT guild_id, COUNT(*) FROM audit_logs GROUP BY guild_id")
+            await db.execute("""
+                CREATE TRIGGER IF NOT EXISTS trg_audit_counters_insert AFTER INSERT ON audit_logs
+                BEGIN
+                    INSERT INTO audit_counters (guild_id, total) VALUES (NEW.guild_id, 1)
+                    ON CONFLICT(guild_id) DO UPDATE SET total = total + 1;
+                END
+            """)
+            await db.execute("""
+                CREATE TRIGGER IF NOT EXISTS trg_audit_counters_delete AFTER DELETE ON audit_logs
+                BEGIN
+                    UPDATE audit_counters SET total = total - 1 WHERE guild_id = OLD.guild_id;
+                END
+            """)
+            
+            # Per-guild ring of 24 hourly event counts (slot = hour % 24) for the
+            # dashboard's last-24h figure; a slot restarts when a new hour reaches it
+            async with db.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'audit_hourly_counts'") as cursor:
+                has_hourly = await cursor.fetchone()
+            if not has_hourly:
+                await db.execute("""
+                    CREATE TABLE audit_hourly_counts (
+                        guild_id INTEGER NOT NULL,
+                        slot INTEGER NOT NULL,
+                        hour INTEGER NOT NULL,
+                        events INTEGER NOT NULL,
+                        PRIMARY KEY (guild_id, slot)
+                    ) WITHOUT ROWID
+                """)
+                await db.execute("""
+                    INSERT INTO audit_hourly_counts (guild_id, slot, hour, events)
+                    SELECT guild_id, hour % 24, hour, COUNT(*)
+                    FROM (SELECT guild_id, CAST(strftime('%s', timestamp) AS INTEGER) / 3600 AS hour FROM audit_logs)
+                    WHERE hour > CAST(strftime('%s', 'now') AS INTEGER) / 3600 - 24
+                    GROUP BY guild_id, hour
+                """)
+            await db.execute("""
+                CREATE TRIGGER IF NOT EXISTS trg_audit_hourly_insert AFTER INSERT ON audit_logs
+                BEGIN
+                    INSERT INTO audit_hourly_counts (guild_id, slot, hour, events)
+                    VALUES (NEW.guild_id, (CAST(strftime('%s', NEW.timestamp) AS INTEGER) / 3600) % 24,
+                            CAST(strftime('%s', NEW.timestamp) AS INTEGER) / 3600, 1)
+                    ON CONFLICT(guild_id, slot) DO UPDATE SET
+                        events = CASE WHEN hour = excluded.hour THEN events + 1
+                                      WHEN hour < excluded.hour THEN 1
+                                      ELSE events END,
+                        hour = MAX(hour, excluded.hour);
+                END
+            """)
+            
+            # Full-text index over the searchable name/value columns. It is an
+            # external-content table (rows live only in audit_logs), kept in sync by triggers
+            try:
+                async with db.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'audit_logs_fts'") as cursor:
+                    has_fts = await cursor.fetchone()
+                if not has_fts:
+                    await db.execute("""
+                        CREATE VIRTUAL TABLE audit_logs_fts USING fts5(
+                            user_name, target_name, moderator_name, before_value, after_value,
+                            content='audit_logs', content_rowid='id',
+                            tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+                        )
+                    """)
+                    await db.execute("INSERT INTO audit_logs_fts (audit_logs_fts) VALUES ('rebuild')")
+                await db.execute("""
+                    CREATE TRIGGER IF NOT EXISTS trg_audit_fts_insert AFTER INSERT ON audit_logs
+                    BEGIN
+                        INSERT INTO audit_logs_fts (rowid, user_name, target_name, moderator_name, before_value, after_value)
+                        VALUES (NEW.id, NEW.user_name, NEW.target_name, NEW.moderator_name, NEW.before_value, NEW.after_value);
+                    END
+                """)
+                await db.execute("""
+                    CREATE TRIGGER IF NOT EXISTS trg_audit_fts_delete AFTER DELETE ON audit_logs
+                    BEGIN
+                        INSERT INTO audit_logs_fts (audit_logs_fts, rowid, user_name, target_name, moderator_name, before_value, after_value)
+                        VALUES ('delete', OLD.id, OLD.user_name, OLD.target_name, OLD.moderator_name, OLD.before_value, OLD.after_value);
+                    END
+                """)
+                await db.execute("""
+                    CREATE TRIGGER IF NOT EXISTS trg_audit_fts_update AFTER UPDATE ON audit_logs
+                    BEGIN
+                        INSERT INTO audit_logs_fts (audit_logs_fts, rowid, user_name, target_name, moderator_name, before_value, after_value)
+                        VALUES ('delete', OLD.id, OLD.user_name, OLD.target_name, OLD.moderator_name, OLD.before_value, OLD.after_value);
+                        INSERT INTO audit_logs_fts (rowid, user_name, target_name, moderator_name, before_value, after_value)
+                        VALUES (NEW.id, NEW.user_name, NEW.target_name, NEW.moderator_name, NEW.before_value, NEW.after_value);
+                    END
+                """)
+            except aiosqlite.OperationalError as e:
+                print(f"⚠️ Full-text search index unavailable, log search will scan: {e}")
+            
             await db.commit()
+            
+            # Refresh planner statistics so the composite indexes get picked. PRAGMA
+            # optimize only re-analyzes tables that already have statistics, so the
+            # first startup has to gather them with a full ANALYZE
+            async with db.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'") as cursor:
+                has_stat_table = await cursor.fetchone()
+            has_stats = None
+            if has_stat_table:
+                async with db.execute("SELECT 1 FROM sqlite_stat1 WHERE tbl = 'audit_logs' LIMIT 1") as cursor:
+                    has_stats = await cursor.fetchone()
+            if has_stats:
+                await db.execute("PRAGMA optimize")
+            else:
+                await db.execute("ANALYZE audit_logs")
+                await db.commit()
             print("✅ Audit database initialized successfully!")
             
     except Exception as e:
@@ -162,54 +328,81 @@ async def init_audit_logs_table():
 
 # ========================= SETTINGS MANAGEMENT =========================
 
-async def get_audit_settings(guild_id: int) -> Dict[str, Any]:
-    """Get audit settings for a guild."""
+def invalidate_audit_settings(guild_id: int):
+    """Drop the cached audit settings for a guild."""
+    _audit_settings_cache.pop(guild_id, None)
+
+async def get_audit_settings(guild_id: int, db=None) -> Dict[str, Any]:
+    """Get audit settings for a guild, served from a short-lived cache.
+    
+    Pass an open connection as `db` to read on it instead of connecting.
+    """
+    cached = _audit_settings_cache.get(guild_id)
+    if cached and cached[0] > time.monotonic():
+        return dict(cached[1])
+    
+    settings = await _load_audit_settings(guild_id, db)
+    if settings is None:  # Read failed; fall back without caching
+        return {'enabled': False, 'log_channel_id': None}
+    _audit_settings_cache[guild_id] = (time.monotonic() + AUDIT_SETTINGS_TTL, settings)
+    return dict(settings)
+
+async def _load_audit_settings(guild_id: int, db=None) -> Optional[Dict[str, Any]]:
+    """Load audit settings for a guild from the database, on `db` if given; None if the read fails."""
     try:
+        if db is not None:
+            return await _read_audit_settings(db, guild_id)
         async with aiosqlite.connect(DB_PATH) as db:
-            async with db.execute("SELECT * FROM audit_settings WHERE guild_id = ?", (guild_id,)) as cursor:
-                result = await cursor.fetchone()
-                
-                if result:
-                    return {
-                        'enabled': bool(result[1]),
-                        'log_channel_id': result[2],
-                        'log_moderation': bool(result[3]) if len(result) > 3 else True,
-                        'log_messages': bool(result[4]) if len(result) > 4 else True,
-                        'log_voice': bool(result[5]) if len(result) > 5 else True,
-                        'log_members': bool(result[6]) if len(result) > 6 else True,
-                        'log_roles': bool(result[7]) if len(result) > 7 else True,
-                        'log_server': bool(result[8]) if len(result) > 8 else True,
-                        'log_stage': bool(result[9]) if len(result) > 9 else True,
-                        'log_avatars': bool(result[10]) if len(result) > 10 else True,
-                        'retention_days': result[11] if len(result) > 11 else 30
-                    }
-                else:
-                    # Create default settings
-                    await db.execute("""
-                        INSERT INTO audit_settings 
-                        (guild_id, enabled, log_channel_id, log_moderation, log_messages, 
-                         log_voice, log_members, log_roles, log_server, log_stage, log_avatars, retention_days)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (guild_id, False, None, True, True, True, True, True, True, True, True, 30))
-                    await db.commit()
-                    
-                    return {
-                        'enabled': False,
-                        'log_channel_id': None,
-                        'log_moderation': True,
-                        'log_messages': True,
-                        'log_voice': True,
-                        'log_members': True,
-                        'log_roles': True,
-                        'log_server': True,
-                        'log_stage': True,
-                        'log_avatars': True,
-                        'retention_days': 30
-                    }
-                    
+            return await _read_audit_settings(db, guild_id)
     except Exception as e:
         print(f"Error getting audit settings: {e}")
-        return {'enabled': False, 'log_channel_id': None}
+        return None
+
+async def _read_audit_settings(db, guild_id: int) -> Dict[str, Any]:
+    """Read (or create) the settings row for a guild on an open connection."""
+    async with db.execute("SELECT * FROM audit_settings WHERE guild_id = ?", (guild_id,)) as cursor:
+        result = await cursor.fetchone()
+        columns = [column[0] for column in cursor.description]
+        
+        if result:
+            return {
+                'enabled': bool(result[1]),
+                'log_channel_id': result[2],
+                'log_moderation': bool(result[3]) if len(result) > 3 else True,
+                'log_messages': bool(result[4]) if len(result) > 4 else True,
+                'log_voice': bool(result[5]) if len(result) > 5 else True,
+                'log_members': bool(result[6]) if len(result) > 6 else True,
+                'log_roles': bool(result[7]) if len(result) > 7 else True,
+                'log_server': bool(result[8]) if len(result) > 8 else True,
+                'log_stage': bool(result[9]) if len(result) > 9 else True,
+                'log_avatars': bool(result[10]) if len(result) > 10 else True,
+                'retention_days': result[11] if len(result) > 11 else 30,
+                'feature_mask': result[columns.index('feature_mask')] if 'feature_mask' in columns else None
+            }
+        else:
+            # Create default settings
+            await db.execute("""
+                INSERT INTO audit_settings 
+                (guild_id, enabled, log_channel_id, log_moderation, log_messages, 
+                 log_voice, log_members, log_roles, log_server, log_stage, log_avatars, retention_days)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (guild_id, False, None, True, True, True, True, True, True, True, True, 30))
+            await db.commit()
+            
+            return {
+                'enabled': False,
+                'log_channel_id': None,
+                'log_moderation': True,
+                'log_messages': True,
+                'log_voice': True,
+                'log_members': True,
+                'log_roles': True,
+                'log_server': True,
+                'log_stage': True,
+                'log_avatars': True,
+                'retention_days': 30,
+                'feature_mask': FEATURE_MASK_ALL
+            }
 
 async def save_audit_settings(guild_id: int, **settings):
     """Save audit settings for a guild."""
@@ -266,11 +459,37 @@ async def save_audit_settings(guild_id: int, **settings):
                 ))
             
             await db.commit()
+            invalidate_audit_settings(guild_id)
             print(f"✅ Saved audit settings for guild {guild_id}")
             
     except Exception as e:
         print(f"Error saving audit settings: {e}")
 
+_TOGGLEABLE_SETTINGS = frozenset(['log_moderation', 'log_messages', 'log_voice', 'log_members',
+                                  'log_roles', 'log_server', 'log_stage', 'log_avatars'])
+
+async def toggle_audit_settings(guild_id: int, keys: List[str]) -> Optional[bool]:
+    """Flip a group of feature flags in one statement; all become on unless any was on.
+    
+    Returns the new state, or None if the guild has no settings row yet.
+    """
+    if not keys or not _TOGGLEABLE_SETTINGS.issuperset(keys):
+        raise ValueError(f"Unknown audit settings: {keys}")
+    
+    any_enabled = " OR ".join(f"IFNULL({key}, 0)" for key in keys)
+    assignments = ", ".join(f"{key} = NOT ({any_enabled})" for key in keys)
+    
+    async with aiosqlite.connect(DB_PATH) as db:
+        async with db.execute(
+            f"UPDATE audit_settings SET {assignments} WHERE guild_id = ? RETURNING {keys[0]}",
+            (guild_id,)
+        ) as cursor:
+            row = await cursor.fetchone()
+        await db.commit()
+    
+    invalidate_audit_settings(guild_id)
+    return bool(row[0]) if row else None
+
 # ========================= LOGGING FUNCTIONS =========================
 
 async def log_audit_event(guild_id: int, event_type: str, **kwargs):
@@ -287,19 +506,8 @@ async def log_audit_event(guild_id: int, event_type: str, **kwargs):
             return
         
         # Check event type filters
-        event_categories = {
-            'moderation': ['member_ban', 'member_unban', 'member_kick', 'member_timeout', 'member_untimeout', 'voice_disconnect'],
-            'messages': ['message_delete', 'message_edit', 'message_bulk_delete'],
-            'voice': ['voice_join', 'voice_leave', 'voice_move', 'voice_mute', 'voice_unmute', 'voice_deafen', 'voice_undeafen', 'voice_disconnect'],
-            'members': ['member_join', 'member_leave', 'member_update', 'nickname_change', 'avatar_change'],
-            'roles': ['role_add', 'role_remove', 'role_create', 'role_delete', 'role_update'],
-            'server': ['channel_create', 'channel_delete', 'channel_update', 'emoji_create', 'emoji_delete', 'emoji_update', 'guild_update'],
-            'stage': ['stage_speaker_add', 'stage_speaker_remove', 'stage_listener_add', 'stage_invite_sent', 'stage_request_speak', 'stage_start', 'stage_end'],
-            'avatars': ['avatar_change']
-        }
-        
         should_log = False
-        for category, events in event_categories.items():
+        for category, events in EVENT_CATEGORIES.items():
             if event_type in events and settings.get(f'log_{category}', True):
                 should_log = True
                 break
@@ -1628,7 +1836,7 @@ class AuditCommands(commands.Cog):
         
         try:
             async with aiosqlite.connect(DB_PATH) as db:
-                query = "SELECT event_type, user_name, target_name, moderator_name, channel_name, reason, timestamp FROM audit_logs WHERE guild_id = ?"
+                query = "SELECT event_type, user_name, target_name, moderator_name, channel_name, reason, ts_epoch FROM audit_logs WHERE guild_id = ?"
                 params = [interaction.guild.id]
                 
                 if event_type:
@@ -1655,14 +1863,10 @@ class AuditCommands(commands.Cog):
                 )
                 
                 for i, log in enumerate(logs[:10], 1):
-                    event_type_val, user_name, target_name, moderator_name, channel_name, reason, timestamp = log
+                    event_type_val, user_name, target_name, moderator_name, channel_name, reason, ts_epoch = log
                     
                     # Format timestamp
-                    try:
-                        dt = datetime.fromisoformat(timestamp)
-                        time_str = f"<t:{int(dt.timestamp())}:R>"
-                    except:
-                        time_str = timestamp
+                    time_str = f"<t:{ts_epoch}:R>" if ts_epoch is not None else "Unknown time"
                     
                     # Build description
                     description = f"**{event_type_val.replace('_', ' ').title()}**"
@@ -1,5 +1,7 @@
+import functools
 import re
 
+@functools.lru_cache(maxsize=1024)
 def get_emoji_thumbnail_url(emoji_str: str) -> str:
     """
     Convert team emoji to a thumbnail URL for Discord embeds.
@@ -17,6 +17,10 @@ async def set_config_value(key: str, value):
         await db.execute("INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)", (key, str(value)))
         await db.commit()
 
+    if key == "team_owner_alert_channel_id":
+        from utils.alerts import invalidate_alert_channel_cache
+        invalidate_alert_channel_cache()
+
 async def get_lft_channel_id():
     """Get the current LFT (Looking for Team) channel ID."""
     return await get_config_value("lft_channel_id", 0)
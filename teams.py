@@ -26,6 +26,13 @@ async def get_team_by_owner(user_id: int):
         async with db.execute("SELECT team_id, role_id, emoji, name, owner_id FROM teams WHERE owner_id = ?", (user_id,)) as cursor:
             return await cursor.fetchone()
 
+async def get_team_member_count(team_id: int):
+    """Get the number of players signed to a team."""
+    async with aiosqlite.connect(DB_PATH) as db:
+        async with db.execute("SELECT COUNT(*) FROM players WHERE team_id = ?", (team_id,)) as cursor:
+            result = await cursor.fetchone()
+            return result[0] if result else 0
+
 async def get_all_teams_with_counts():
     """Get all teams with their member counts."""
     async with aiosqlite.connect(DB_PATH) as db: